@@ -0,0 +1,38 @@
+# 코드 인식 지연 시간: 100ms 프레임 하나를 실시간으로 들어오는 대로 분석할 때와 클립 전체를 한 번에 분석할 때
+# 실행: python benchmarks/bench_analysis.py  (저장소 루트의 chord.wav / arpeggio.wav 사용)
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from chordplay.analysis import FRAME_SECONDS, detect_chord, detect_frames, read_wav
+
+REPEAT = 200
+
+def measure(analyze):
+    analyze()
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        analyze()
+        timings.append(time.perf_counter() - start)
+    return np.percentile(timings, [50, 99]) * 1000
+
+def main():
+    print(f"{'fixture':<14}{'detected':<14}{'case':<10}{'frames':>7}{'p50 ms':>9}{'p99 ms':>9}")
+    for name in ('chord.wav', 'arpeggio.wav'):
+        samples, sample_rate = read_wav(os.path.join(ROOT, name))
+        root, chord_type, _ = detect_chord(samples, sample_rate)
+        frame = samples[:int(sample_rate * FRAME_SECONDS)]
+        cases = (('frame', 1, lambda: detect_frames(frame, sample_rate)),
+                 ('clip', len(samples) // len(frame), lambda: detect_chord(samples, sample_rate)))
+        for case, frames, analyze in cases:
+            p50, p99 = measure(analyze)
+            print(f"{name:<14}{root + ' ' + chord_type:<14}{case:<10}{frames:>7}{p50:>9.3f}{p99:>9.3f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# rerun마다 페이지 머리(파비콘 + 스타일시트 + 로고)를 준비하는 시간과 전송 바이트 비교
+# 실행: python benchmarks/bench_assets.py
+import os
+import sys
+import time
+
+from streamlit import logger as streamlit_logger
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from chordplay.app import img_to_base64, load_page_assets, read_stylesheet
+
+REPEAT = 50
+
+# 이전 방식: rerun마다 로고를 두 번 읽어 base64로 인코딩하고 HTML에 그대로 넣음
+def legacy_page_assets(app_dir, stylesheet, use_static):
+    logo_base64 = img_to_base64(os.path.join(app_dir, 'static', 'logo.png'))
+    favicon_base64 = img_to_base64(os.path.join(app_dir, 'static', 'logo.png'))
+    head_html = (f"<style>\n{read_stylesheet(stylesheet)}</style>\n\n"
+                 f'<img src="data:image/png;base64,{logo_base64}" class="logo-img">')
+    return f"data:image/png;base64,{favicon_base64}", head_html
+
+def measure(prepare, use_static):
+    prepare(ROOT, 'light', use_static)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        page_icon, head_html = prepare(ROOT, 'light', use_static)
+    elapsed_ms = (time.perf_counter() - start) / REPEAT * 1000
+    return elapsed_ms, len(page_icon) + len(head_html.encode('utf-8'))
+
+def main():
+    # 스크립트 실행 컨텍스트 밖에서 st.cache_resource를 쓸 때 나오는 경고는 생략
+    streamlit_logger.set_log_level('error')
+    print(f"{'variant':<22}{'ms / rerun':>12}{'bytes / rerun':>15}")
+    for name, prepare, use_static in [
+        ('before', legacy_page_assets, False),
+        ('after (inline cache)', load_page_assets, False),
+        ('after (static file)', load_page_assets, True),
+    ]:
+        elapsed_ms, size = measure(prepare, use_static)
+        print(f"{name:<22}{elapsed_ms:>12.3f}{size:>15}")
+
+if __name__ == '__main__':
+    main()
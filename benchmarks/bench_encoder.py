@@ -0,0 +1,45 @@
+# 무압축 WAV와 압축 코덱의 크기 / 인코딩 지연 비교
+# 실행: python benchmarks/bench_encoder.py  (ffmpeg가 PATH에 있어야 압축 코덱이 측정됨)
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from chordplay.encoder import CODECS, encode_audio, ffmpeg_available
+
+SAMPLE_RATE = 44100
+BITRATES = ('32k', '64k', '96k')
+REPEAT = 5
+
+# 앱의 블록 코드(2초)와 같은 형태의 C Major7 테스트 신호
+def test_chord(duration=2, sample_rate=SAMPLE_RATE):
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    chord = sum(np.sin(2 * np.pi * freq * t) for freq in (261.63, 329.63, 392.00, 493.88))
+    chord /= np.max(np.abs(chord))
+    return (chord * 32767).astype(np.int16)
+
+def measure(audio_data, codec, bitrate):
+    encode_audio(audio_data, SAMPLE_RATE, codec, bitrate)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        data, _ = encode_audio(audio_data, SAMPLE_RATE, codec, bitrate)
+    return len(data), (time.perf_counter() - start) / REPEAT * 1000
+
+def main():
+    audio_data = test_chord()
+    wav_size, wav_ms = measure(audio_data, 'wav', None)
+    print(f"{'codec':<8}{'bitrate':>8}{'bytes':>10}{'vs wav':>9}{'encode ms':>11}")
+    print(f"{'wav':<8}{'-':>8}{wav_size:>10}{1:>8.0%}{wav_ms:>11.2f}")
+    if not ffmpeg_available():
+        print("ffmpeg not found on PATH; compressed codecs skipped")
+        return
+    for codec in CODECS:
+        for bitrate in BITRATES:
+            size, ms = measure(audio_data, codec, bitrate)
+            print(f"{codec:<8}{bitrate:>8}{size:>10}{size / wav_size:>8.0%}{ms:>11.2f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# np.sin 경로와 웨이브테이블 오실레이터의 초당 샘플 수 비교
+# 실행: python benchmarks/bench_oscillator.py
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from chordplay.oscillator import HARMONICS, WavetableOscillator
+from chordplay.synth import create_sine_wave
+
+SAMPLE_RATE = 44100
+DURATION = 2
+FREQ = 440.0
+REPEAT = 50
+
+# 같은 배음 구성을 np.sin으로 직접 더하는 경우 (웨이브테이블 없이 음색을 만들 때의 비용)
+def additive_wave(harmonics):
+    def render(freq, duration, sample_rate=SAMPLE_RATE):
+        t = np.linspace(0, duration, int(sample_rate * duration), False)
+        wave = np.zeros_like(t)
+        for k, amplitude in enumerate(harmonics, start=1):
+            if amplitude:
+                wave += amplitude * np.sin(2 * np.pi * freq * k * t)
+        return wave
+    return render
+
+def samples_per_second(render):
+    render(FREQ, DURATION)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        render(FREQ, DURATION)
+    elapsed = time.perf_counter() - start
+    return REPEAT * int(SAMPLE_RATE * DURATION) / elapsed
+
+def main():
+    print(f"{'waveform':<10}{'np.sin':>16}{'wavetable':>16}{'speedup':>10}")
+    for waveform, harmonics in HARMONICS.items():
+        reference = create_sine_wave if waveform == 'sine' else additive_wave(harmonics)
+        baseline = samples_per_second(reference)
+        wavetable = samples_per_second(WavetableOscillator(waveform))
+        print(f"{waveform:<10}{baseline / 1e6:>13.1f} M/s{wavetable / 1e6:>13.1f} M/s{wavetable / baseline:>9.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+# 32마디 진행(ii–V–I 8개, 키를 완전4도씩 이동)을 overlap-add 한 번으로 렌더링할 때와
+# 코드마다 create_chord_audio로 만들어 이어 붙일 때의 시간 비교. 실시간 대비 배율도 출력
+# 실행: python benchmarks/bench_progression.py [--bpm 120]
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from chordplay.progression import ii_v_i, render_progression, transpose_key, voice_progression
+from chordplay.synth import SAMPLE_RATE, SYNTH_DTYPE, create_chord_audio, notes_to_freqs
+
+REPEAT = 5
+
+# ii–V–I 하나가 4마디 (4/4 기준 ii 1마디, V 1마디, I 2마디)
+def thirty_two_bars():
+    steps = []
+    for i in range(8):
+        steps += ii_v_i(transpose_key('C', 5 * i))
+    return steps
+
+def render_concatenated(steps, bpm):
+    voicings = voice_progression(steps)
+    return np.concatenate([create_chord_audio(notes_to_freqs(voicing), beats * 60 / bpm, SAMPLE_RATE, dtype=SYNTH_DTYPE)
+                           for voicing, (_, _, beats) in zip(voicings, steps)])
+
+def measure(render):
+    render()
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        audio = render()
+    return audio, (time.perf_counter() - start) / REPEAT
+
+def main():
+    parser = argparse.ArgumentParser(description='32-bar progression render time')
+    parser.add_argument('--bpm', type=int, default=120)
+    args = parser.parse_args()
+
+    steps = thirty_two_bars()
+    print(f"{'renderer':<14}{'audio s':>9}{'render ms':>11}{'x realtime':>12}")
+    for name, render in (('overlap-add', lambda: render_progression(steps, args.bpm)),
+                         ('concatenated', lambda: render_concatenated(steps, args.bpm))):
+        audio, seconds = measure(render)
+        audio_seconds = len(audio) / SAMPLE_RATE
+        print(f"{name:<14}{audio_seconds:>9.1f}{seconds * 1000:>11.1f}{audio_seconds / seconds:>12.0f}")
+
+if __name__ == '__main__':
+    main()
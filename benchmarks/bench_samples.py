@@ -0,0 +1,50 @@
+# 샘플 뱅크 재생: 뱅크를 여는 시간과, np.sin / 웨이브테이블 / 샘플 뱅크로 블록 코드를 만들 때의 시간 비교
+# 실행: python benchmarks/bench_samples.py [--bank 폴더]  (폴더를 주지 않으면 piano 웨이브테이블로 임시 뱅크를 만듦)
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from chordplay.oscillator import WavetableOscillator
+from chordplay.samples import SampleBank, write_sample_bank
+from chordplay.synth import SAMPLE_RATE, create_chord_audio, create_sine_wave, notes_to_freqs
+from chordplay.theory import chord_types, generate_correct_answer, keys
+
+REPEAT = 3
+
+def measure(oscillator, chords):
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for freqs in chords:
+            create_chord_audio(freqs, 2, SAMPLE_RATE, oscillator=oscillator, dtype=np.float32)
+    return (time.perf_counter() - start) / REPEAT / len(chords) * 1000
+
+def run(directory):
+    start = time.perf_counter()
+    bank = SampleBank(directory)
+    print(f"opened {len(bank.notes)} samples in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    chords = [notes_to_freqs(generate_correct_answer(key, chord_type)) for key in keys for chord_type in chord_types]
+    print(f"{'oscillator':<12}{'ms / chord':>11}")
+    for name, oscillator in (('sine', create_sine_wave), ('wavetable', WavetableOscillator('piano')),
+                             ('sample bank', bank)):
+        print(f"{name:<12}{measure(oscillator, chords):>11.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Sample bank load and render time')
+    parser.add_argument('--bank', help='directory of per-note WAV files')
+    args = parser.parse_args()
+    if args.bank:
+        run(args.bank)
+        return
+    with tempfile.TemporaryDirectory() as directory:
+        write_sample_bank(directory, WavetableOscillator('piano'))
+        run(directory)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+# 드릴 트랙 전체를 한 번에 합성하는 방식과 스트리밍 렌더러의 최대 메모리 / 처리 시간 비교
+# 실행: python benchmarks/bench_stream.py [--bpm 120]
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from chordplay.encoder import audio_to_wav_bytes
+from chordplay.stream import drill_length, drill_segments, render_segment, stream_wav
+from chordplay.synth import SAMPLE_RATE
+
+def render_whole(bpm):
+    segments = drill_segments(bpm)
+    return len(audio_to_wav_bytes(np.concatenate([render_segment(segment) for segment in segments]), SAMPLE_RATE))
+
+# 구간은 제너레이터로 하나씩 받고 헤더 길이는 drill_length로 미리 계산
+def render_streamed(bpm):
+    return sum(len(data) for data in stream_wav(drill_segments(bpm), num_samples=drill_length(bpm)))
+
+def measure(render, bpm):
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = render(bpm)
+    seconds = time.perf_counter() - start
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size, seconds, peak_bytes
+
+def main():
+    parser = argparse.ArgumentParser(description='Whole-track vs streamed drill track rendering')
+    parser.add_argument('--bpm', type=int, default=120)
+    args = parser.parse_args()
+
+    print(f"{'renderer':<10}{'MB':>8}{'seconds':>9}{'peak MB':>9}")
+    for name, render in (('whole', render_whole), ('streamed', render_streamed)):
+        size, seconds, peak_bytes = measure(render, args.bpm)
+        print(f"{name:<10}{size / 1e6:>8.1f}{seconds:>9.2f}{peak_bytes / 1e6:>9.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# 긴 녹음 분석: 스트리밍 렌더러로 만든 드릴 트랙 WAV를 chord_timeline으로 분석해
+# 실시간 대비 처리 속도, 최대 메모리, 기대 타임라인과의 일치 비율을 출력
+# 실행: python benchmarks/bench_timeline.py [--chords 120] [--bpm 120]
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from chordplay.analysis import chord_timeline, timeline_agreement
+from chordplay.stream import drill_segments, segment_length, write_wav
+from chordplay.synth import SAMPLE_RATE
+from chordplay.theory import chord_types, keys
+
+# 드릴 트랙에서 구간마다 어떤 코드가 나와야 하는지 (블록 코드와 그 전위 아르페지오가 번갈아 나옴)
+def expected_timeline(segments, items):
+    timeline = []
+    start = 0.0
+    for i, segment in enumerate(segments):
+        end = start + segment_length(segment) / SAMPLE_RATE
+        timeline.append((start, end) + items[i // 2])
+        start = end
+    return timeline
+
+def main():
+    parser = argparse.ArgumentParser(description='Chord timeline analysis of a long drill recording')
+    parser.add_argument('--chords', type=int, default=120)
+    parser.add_argument('--bpm', type=int, default=120)
+    args = parser.parse_args()
+
+    items = [(key, chord_type) for key in keys for chord_type in chord_types][:args.chords]
+    segments = list(drill_segments(args.bpm, items=items))
+    expected = expected_timeline(segments, items)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'drill.wav')
+        with open(path, 'wb') as wav_file:
+            write_wav(wav_file, segments)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        timeline = chord_timeline(path)
+        seconds = time.perf_counter() - start
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    audio_seconds = expected[-1][1]
+    print(f"audio {audio_seconds:.0f} s, analyzed in {seconds:.2f} s ({audio_seconds / seconds:.0f}x real time)")
+    print(f"peak memory {peak_bytes / 1e6:.1f} MB, {len(timeline)} segments for {len(items)} chords")
+    print(f"agreement with the drill timeline: {timeline_agreement(timeline, expected):.0%}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+# 동시 세션 부하 테스트. 로컬에서 `streamlit run main.py` 서버를 띄우고, 브라우저 대신 웹소켓 클라이언트 N개가
+# Streamlit 프로토콜(BackMsg / ForwardMsg protobuf)로 새로고침 / 전위 토글 / BPM 드래그 / 재생 / 구성음 토글을 누른다.
+# 실행: python benchmarks/load_test.py [--sessions 1 2 4 8 16 32] [--steps 20] [--target-p99-ms 500]
+# 의존성: pip install -r benchmarks/requirements.txt (웹소켓 클라이언트 websockets는 Streamlit 버전에 따라 함께 설치되지 않음)
+#
+# 세션 수 단계마다 rerun 지연 p50/p99, 서버 프로세스 CPU 사용 시간, 세션당 RSS 증가량을 보고하고
+# p99가 목표를 넘는 단계에서 멈춘다. 네트워크는 127.0.0.1만 사용한다.
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import numpy as np
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+APP_PATH = os.path.join(ROOT, 'main.py')
+
+# 실제 사용 패턴을 흉내 낸 동작별 가중치
+ACTIONS = {
+    'refresh': 3,
+    'toggle_inversions': 2,
+    'drag_bpm': 3,
+    'play': 5,
+    'toggle_notes': 2,
+}
+
+# 동작 -> 앱 위젯의 key (BPM 슬라이더는 key가 없어 위젯 종류로 찾음)
+WIDGET_KEYS = {
+    'refresh': 'refresh',
+    'toggle_inversions': 'include_inversions',
+    'play': 'play_chord',
+    'toggle_notes': 'toggle_show_notes',
+}
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def start_server(port):
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP_PATH,
+         '--server.headless', 'true', '--server.address', '127.0.0.1', '--server.port', str(port),
+         '--browser.gatherUsageStats', 'false', '--server.fileWatcherType', 'none'],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    for _ in range(100):
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1) as response:
+                if response.read() == b'ok':
+                    return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError('streamlit server did not become healthy')
+
+# 서버 프로세스의 누적 CPU 시간(초)과 RSS(바이트)
+def process_usage(pid):
+    with open(f'/proc/{pid}/stat', encoding='ascii') as stat:
+        fields = stat.read().rsplit(')', 1)[1].split()
+    cpu_seconds = (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+    with open(f'/proc/{pid}/status', encoding='ascii') as status:
+        rss = next(int(line.split()[1]) * 1024 for line in status if line.startswith('VmRSS:'))
+    return cpu_seconds, rss
+
+# 브라우저 탭 하나를 흉내 내는 세션. 받은 위젯 정보로 위젯 상태를 만들어 rerun을 요청한다
+class Session:
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.widgets = {}  # 이름 -> (위젯 id, fragment id)
+        self.values = {}  # 위젯 id -> 현재 값
+        self.page_script_hash = ''
+
+    async def __aenter__(self):
+        self.connection = await websockets.connect(self.url, subprotocols=['streamlit'], max_size=None)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.connection.close()
+
+    def widget_states(self, trigger_id=None):
+        back_msg = BackMsg()
+        client_state = back_msg.rerun_script
+        client_state.page_script_hash = self.page_script_hash
+        for widget_id, value in self.values.items():
+            state = client_state.widget_states.widgets.add()
+            state.id = widget_id
+            if isinstance(value, bool):
+                state.bool_value = value
+            else:
+                state.double_array_value.data.append(value)
+        if trigger_id is not None:
+            state = client_state.widget_states.widgets.add()
+            state.id = trigger_id
+            state.trigger_value = True
+        return back_msg
+
+    def remember_widget(self, msg):
+        element = msg.delta.new_element
+        element_type = element.WhichOneof('type')
+        if element_type not in ('button', 'checkbox', 'slider'):
+            return
+        widget = getattr(element, element_type)
+        if element_type == 'slider':
+            name = 'drag_bpm'
+            self.values.setdefault(widget.id, float(widget.value[0] if widget.value else widget.default[0]))
+        else:
+            name = next((action for action, key in WIDGET_KEYS.items() if widget.id.endswith(f'-{key}')), None)
+            if element_type == 'checkbox':
+                self.values.setdefault(widget.id, bool(widget.default))
+        if name:
+            self.widgets[name] = (widget.id, msg.delta.fragment_id or None)
+
+    # rerun 요청을 보내고 (fragment만이 아니라 전체가 다시 실행되는 경우까지) 끝날 때까지의 시간을 잰다
+    async def rerun(self, back_msg):
+        start = time.perf_counter()
+        await self.connection.send(back_msg.SerializeToString())
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await self.connection.recv())
+            message_type = msg.WhichOneof('type')
+            if message_type == 'new_session':
+                self.page_script_hash = msg.new_session.page_script_hash
+            elif message_type == 'delta':
+                self.remember_widget(msg)
+            elif message_type == 'script_finished':
+                if msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return time.perf_counter() - start
+
+    async def load(self):
+        return await self.rerun(self.widget_states())
+
+    async def perform(self, action):
+        widget_id, fragment_id = self.widgets[action]
+        if action in ('refresh', 'play'):
+            back_msg = self.widget_states(trigger_id=widget_id)
+        else:
+            if action == 'drag_bpm':
+                self.values[widget_id] = float(self.rng.randint(60, 240))
+            else:
+                self.values[widget_id] = not self.values[widget_id]
+            back_msg = self.widget_states()
+        if fragment_id:
+            back_msg.rerun_script.fragment_id = fragment_id
+        return await self.rerun(back_msg)
+
+async def run_session(url, seed, steps, think_seconds):
+    rng = random.Random(seed)
+    actions, weights = zip(*ACTIONS.items())
+    async with Session(url, rng) as session:
+        latencies = [await session.load()]
+        for _ in range(steps):
+            await asyncio.sleep(rng.uniform(0, think_seconds))
+            latencies.append(await session.perform(rng.choices(actions, weights)[0]))
+    return latencies
+
+async def run_level(url, server_pid, sessions, steps, think_seconds):
+    cpu_before, rss_before = process_usage(server_pid)
+    wall_before = time.perf_counter()
+    results = await asyncio.gather(*(run_session(url, seed, steps, think_seconds) for seed in range(sessions)))
+    cpu_after, rss_after = process_usage(server_pid)
+    latencies = np.array([latency for session in results for latency in session]) * 1000
+    return {
+        'sessions': sessions,
+        'reruns': len(latencies),
+        'p50_ms': np.percentile(latencies, 50),
+        'p99_ms': np.percentile(latencies, 99),
+        'cpu_s': cpu_after - cpu_before,
+        'wall_s': time.perf_counter() - wall_before,
+        'rss_per_session_kb': (rss_after - rss_before) / sessions / 1024,
+    }
+
+async def run(args):
+    port = free_port()
+    server = start_server(port)
+    url = f'ws://127.0.0.1:{port}/_stcore/stream'
+    try:
+        print(f"{'sessions':>8}{'reruns':>8}{'p50 ms':>9}{'p99 ms':>9}{'cpu s':>8}{'wall s':>8}{'RSS/session KB':>16}")
+        for sessions in args.sessions:
+            level = await run_level(url, server.pid, sessions, args.steps, args.think_ms / 1000)
+            print(f"{level['sessions']:>8}{level['reruns']:>8}{level['p50_ms']:>9.1f}{level['p99_ms']:>9.1f}"
+                  f"{level['cpu_s']:>8.1f}{level['wall_s']:>8.1f}{level['rss_per_session_kb']:>16.0f}")
+            if level['p99_ms'] > args.target_p99_ms:
+                print(f"p99 exceeded {args.target_p99_ms:.0f} ms at {sessions} concurrent sessions")
+                return
+        print(f"p99 stayed under {args.target_p99_ms:.0f} ms up to {args.sessions[-1]} concurrent sessions")
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description='ChordPlay concurrent-session load test')
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument('--steps', type=int, default=20, help='interactions per session')
+    parser.add_argument('--think-ms', type=float, default=200, help='max pause between interactions')
+    parser.add_argument('--target-p99-ms', type=float, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+# 이론 / 합성 함수 회귀 벤치마크
+# 실행: python benchmarks/run_suite.py [--quick] [--threshold 0.25] [--no-save] [--pin]
+#
+# 각 벤치마크의 지연 시간 분포(p50/p90/p99), 처리량, 최대 메모리를 측정해 history.json에 누적하고,
+# 기준 p50보다 threshold 이상 느려진 벤치마크가 있으면 종료 코드 1로 실패한다.
+# 기준은 최근 BASELINE_RUNS번 기록의 벤치마크별 p50 중앙값이며, --pin으로 고정한 기록이 있으면 그것과도 비교한다.
+# 회귀가 난 기록과 --filter로 일부만 돌린 기록은 기준이 되지 않도록 저장하지 않는다
+# (느려진 것을 받아들이려면 --pin으로 새 고정 기준을 저장).
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from chordplay.synth import (create_arpeggio_audio, create_chord_audio, create_sine_wave, get_audio_base64,
+                             note_to_freq, notes_to_freqs)
+from chordplay.theory import (chord_inversions, chord_types, generate_correct_answer, generate_inversions, identify_chord,
+                              keys)
+from chordplay.voicing import iter_voicings
+
+HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'history.json')
+ALL_CHORDS = [(key, chord_type) for key in keys for chord_type in chord_types]
+BPMS = (60, 120, 180, 240)
+SUBDIVISIONS = (2, 4)  # 8분음표, 16분음표
+SAMPLE_RATES = (22050, 32000, 44100)
+BASELINE_RUNS = 5
+
+# 벤치마크 하나는 (이름, 케이스 목록)이며 케이스는 (호출할 함수, 결과 샘플 수)
+# 한 번의 측정 = 케이스 전체를 한 번씩 호출. 처리량은 초당 호출 수와 초당 샘플 수로 계산
+def build_benchmarks(quick):
+    chords = ALL_CHORDS[::12] if quick else ALL_CHORDS
+    chord_notes = {item: generate_correct_answer(*item) for item in chords}
+    inversions = {item: generate_inversions(notes) for item, notes in chord_notes.items()}
+    sample_rates = SAMPLE_RATES[-1:] if quick else SAMPLE_RATES
+    benchmarks = {}
+
+    benchmarks['generate_correct_answer'] = [
+        (lambda item=item: generate_correct_answer(*item), 0) for item in chords
+    ]
+    benchmarks['generate_inversions'] = [
+        (lambda notes=notes: generate_inversions(notes), 0) for notes in chord_notes.values()
+    ]
+    benchmarks['iter_voicings'] = [
+        (lambda notes=notes: list(iter_voicings(notes)), 0) for notes in chord_notes.values()
+    ]
+    benchmarks['identify_chord'] = [
+        (lambda notes=notes: [identify_chord(inversion) for inversion in chord_inversions(notes)], 0)
+        for notes in chord_notes.values()
+    ]
+    benchmarks['note_to_freq'] = [
+        (lambda notes=notes: [note_to_freq(note) for note in notes], 0) for notes in inversions.values()
+    ]
+    benchmarks['notes_to_freqs'] = [
+        (lambda notes=notes: notes_to_freqs(notes), 0) for notes in inversions.values()
+    ]
+    for sample_rate in sample_rates:
+        benchmarks[f'create_sine_wave[{sample_rate}]'] = [
+            (lambda freq=freq, sample_rate=sample_rate: create_sine_wave(freq, 1, sample_rate), sample_rate)
+            for freq in notes_to_freqs(range(60, 84))
+        ]
+        benchmarks[f'create_chord_audio[{sample_rate}]'] = [
+            (lambda freqs=notes_to_freqs(notes), sample_rate=sample_rate:
+                create_chord_audio(freqs, 2, sample_rate, dtype=np.float32), 2 * sample_rate)
+            for notes in chord_notes.values()
+        ]
+        for subdivision in SUBDIVISIONS:
+            for bpm in BPMS:
+                benchmarks[f'create_arpeggio_audio[{sample_rate},{bpm}bpm,1/{subdivision * 4}]'] = [
+                    (lambda freqs=notes_to_freqs(notes), bpm=bpm, sample_rate=sample_rate, subdivision=subdivision:
+                        create_arpeggio_audio(freqs, bpm, sample_rate, dtype=np.float32, subdivision=subdivision),
+                     len(notes) * int(sample_rate * 60 / bpm / subdivision))
+                    for notes in inversions.values()
+                ]
+        chord_audio = create_chord_audio(notes_to_freqs(chord_notes[chords[0]]), 2, sample_rate)
+        benchmarks[f'get_audio_base64[{sample_rate}]'] = [
+            (lambda audio=chord_audio, sample_rate=sample_rate: get_audio_base64(audio, sample_rate), len(chord_audio))
+        ]
+    return benchmarks
+
+def run_benchmark(cases, repeat):
+    for render, _ in cases:
+        render()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for render, _ in cases:
+            render()
+        timings.append(time.perf_counter() - start)
+
+    # 메모리는 시간 측정과 분리해서 한 번만 측정 (tracemalloc이 실행을 느리게 하므로)
+    tracemalloc.start()
+    for render, _ in cases:
+        render()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    timings = np.array(timings)
+    samples = sum(sample_count for _, sample_count in cases)
+    p50, p90, p99 = np.percentile(timings, [50, 90, 99]) * 1000
+    return {
+        'calls': len(cases),
+        'p50_ms': p50,
+        'p90_ms': p90,
+        'p99_ms': p99,
+        'calls_per_s': len(cases) / np.median(timings),
+        'samples_per_s': samples / np.median(timings) if samples else None,
+        'peak_bytes': peak_bytes,
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as history_file:
+        return json.load(history_file)
+
+# 같은 옵션(--quick)의 기록 중 최근 runs번에서 벤치마크별 p50 중앙값 (일부만 측정된 예전 기록도 해당 벤치마크만 반영)
+def rolling_baseline(history, quick, runs=BASELINE_RUNS):
+    recent = [run['results'] for run in history if run['quick'] == quick][-runs:]
+    names = {name for results in recent for name in results}
+    return {name: {'p50_ms': float(np.median([results[name]['p50_ms'] for results in recent if name in results]))}
+            for name in names}
+
+def pinned_baseline(history, quick):
+    return next((run['results'] for run in reversed(history) if run['quick'] == quick and run.get('pinned')), {})
+
+# 기준과 비교해 p50이 threshold 비율 이상 늘어난 벤치마크 목록을 반환
+def find_regressions(results, previous, threshold):
+    regressions = []
+    for name, result in results.items():
+        before = previous.get(name)
+        if before and result['p50_ms'] > before['p50_ms'] * (1 + threshold):
+            regressions.append((name, before['p50_ms'], result['p50_ms']))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='ChordPlay theory / synthesis benchmark suite')
+    parser.add_argument('--quick', action='store_true', help='10 chords and 44100 Hz only')
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed p50 slowdown (0.25 = 25%%)')
+    parser.add_argument('--history', default=HISTORY_PATH)
+    parser.add_argument('--no-save', action='store_true', help='compare only, do not append to the history')
+    parser.add_argument('--filter', default='', help='run only benchmarks whose name contains this text (not saved)')
+    parser.add_argument('--pin', action='store_true', help='save this run as the pinned baseline, even if it regressed')
+    args = parser.parse_args()
+    if args.pin and (args.filter or args.no_save):
+        parser.error('--pin needs a full, saved run')
+
+    results = {}
+    print(f"{'benchmark':<44}{'p50 ms':>10}{'p99 ms':>10}{'calls/s':>11}{'Msamples/s':>12}{'peak KB':>10}")
+    for name, cases in build_benchmarks(args.quick).items():
+        if args.filter not in name:
+            continue
+        result = run_benchmark(cases, args.repeat)
+        results[name] = result
+        samples_per_s = f"{result['samples_per_s'] / 1e6:.1f}" if result['samples_per_s'] else '-'
+        print(f"{name:<44}{result['p50_ms']:>10.3f}{result['p99_ms']:>10.3f}{result['calls_per_s']:>11.0f}"
+              f"{samples_per_s:>12}{result['peak_bytes'] / 1024:>10.0f}")
+
+    history = load_history(args.history)
+    regressions = find_regressions(results, rolling_baseline(history, args.quick), args.threshold)
+    regressions += [(f'{name} (pinned)', before, after) for name, before, after
+                    in find_regressions(results, pinned_baseline(history, args.quick), args.threshold)]
+
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: p50 {before:.3f} ms -> {after:.3f} ms (+{after / before - 1:.0%})")
+    if args.no_save:
+        pass
+    elif args.filter:
+        print("partial run (--filter): not saved to the history")
+    elif regressions and not args.pin:
+        print("run regressed: not saved to the history (use --pin to accept it as the new baseline)")
+    else:
+        history.append({
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'quick': args.quick,
+            'pinned': args.pin,
+            'results': results,
+        })
+        with open(args.history, 'w', encoding='utf-8') as history_file:
+            json.dump(history, history_file, indent=1)
+    if regressions and not args.pin:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
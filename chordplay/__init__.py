@@ -0,0 +1,73 @@
+# ChordPlay 엔진. Streamlit 없이 가져다 쓸 수 있고, NumPy가 필요한 모듈은 처음 사용할 때 불러온다
+#   import chordplay
+#   chordplay.generate_correct_answer('C', 'Major7')   # chordplay.theory만 로드
+#   chordplay.create_chord_audio(...)                  # 이때 chordplay.synth와 NumPy를 로드
+import importlib
+
+_EXPORTS = {
+    'keys': 'theory',
+    'chord_types': 'theory',
+    'NOTE_NAMES': 'theory',
+    'CHORD_INTERVALS': 'theory',
+    'extended_chord_types': 'theory',
+    'CHORD_INDEX': 'theory',
+    'Note': 'theory',
+    'as_note': 'theory',
+    'generate_correct_answer': 'theory',
+    'generate_inversions': 'theory',
+    'chord_inversions': 'theory',
+    'iter_inversions': 'theory',
+    'iter_inversion_arpeggio': 'theory',
+    'pitch_class_mask': 'theory',
+    'identify_chord': 'theory',
+    'chord_name': 'theory',
+    'raise_octave': 'theory',
+    'A4_FREQ': 'synth',
+    'FREQ_TABLE': 'synth',
+    'get_freq_table': 'synth',
+    'note_to_freq': 'synth',
+    'notes_to_freqs': 'synth',
+    'create_sine_wave': 'synth',
+    'create_chord_audio': 'synth',
+    'create_arpeggio_audio': 'synth',
+    'create_chord_batch_audio': 'synth',
+    'generate_quiz_set': 'synth',
+    'get_audio_base64': 'synth',
+    'WavetableOscillator': 'oscillator',
+    'SampleBank': 'samples',
+    'encode_audio': 'encoder',
+    'audio_to_wav_bytes': 'encoder',
+    'AudioCache': 'cache',
+    'VOICING_STYLES': 'voicing',
+    'iter_voicings': 'voicing',
+    'ii_v_i': 'progression',
+    'voice_progression': 'progression',
+    'render_progression': 'progression',
+    'chromagram': 'analysis',
+    'detect_chord': 'analysis',
+    'check_chord': 'analysis',
+    'open_wav_memmap': 'analysis',
+    'chord_timeline': 'analysis',
+    'drill_segments': 'stream',
+    'drill_length': 'stream',
+    'stream_audio': 'stream',
+    'stream_wav': 'stream',
+    'write_wav': 'stream',
+    'render_answer_audio': 'render',
+    'render_answer_clip': 'render',
+    'AudioPack': 'pack',
+    'pick_exercises': 'exercises',
+    'write_exercise_zip': 'exercises',
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'chordplay' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'chordplay.{_EXPORTS[name]}'), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
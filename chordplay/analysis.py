@@ -0,0 +1,254 @@
+# 오디오에서 코드를 인식하는 분석 파이프라인. 업로드한 WAV나 브라우저 마이크 녹음을 100ms 프레임으로 나눠
+# FFT 크로마그램(피치 클래스별 에너지)을 만들고, 코드 템플릿과의 코사인 유사도로 가장 가까운 코드를 찾는다
+#   samples, sample_rate = read_wav('chord.wav')
+#   detect_chord(samples, sample_rate)   # ('G#', 'Major', 0.997)
+import functools
+import os
+import struct
+import wave
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from chordplay.synth import A4_FREQ
+from chordplay.theory import CHORD_INTERVALS, NOTE_INDEX, NOTE_NAMES, chord_types, pitch_class_mask
+
+FRAME_SECONDS = 0.1  # 분석 프레임 길이
+FREQ_RANGE = (55.0, 2000.0)  # 크로마에 넣을 주파수 범위 (A1 ~ B6 근처, 그 밖은 잡음이 대부분)
+SILENCE_RMS = 1e-3  # 이보다 조용한 프레임은 판정에서 제외
+HOP_SECONDS = 0.05  # 긴 녹음 분석 시 프레임 간격 (프레임끼리 절반씩 겹침)
+BATCH_FRAMES = 64  # 한 번에 rfft 하는 프레임 수 (메모리 사용량 상한을 정함)
+SMOOTHING_SECONDS = 1.5  # 타임라인 판정 시 크로마를 합산하는 구간 (아르페지오도 코드로 인식되도록)
+MIN_SEGMENT_SECONDS = 0.2  # 이보다 짧게 잡힌 코드 구간은 잡음으로 보고 앞 구간에 합침
+
+# WAV 파일(경로 또는 파일 객체)을 모노 float32 [-1, 1] 배열과 샘플레이트로 읽는다
+def read_wav(file):
+    try:
+        with wave.open(file, 'rb') as wav_file:
+            channels = wav_file.getnchannels()
+            sample_width = wav_file.getsampwidth()
+            sample_rate = wav_file.getframerate()
+            frames = wav_file.readframes(wav_file.getnframes())
+    except (wave.Error, EOFError) as error:
+        raise ValueError('not a PCM WAV file') from error
+    if sample_width not in (1, 2, 4):
+        raise ValueError(f"unsupported WAV sample width: {sample_width * 8} bits")
+    samples = np.frombuffer(frames, dtype={1: 'u1', 2: '<i2', 4: '<i4'}[sample_width]).astype(np.float32)
+    if sample_width == 1:
+        samples -= 128  # 8비트 WAV는 부호 없는 정수
+    samples /= 2 ** (sample_width * 8 - 1)
+    return samples.reshape(-1, channels).mean(axis=1), sample_rate
+
+# 프레임 길이의 두 배 이상인 2의 거듭제곱으로 zero-padding (100ms 프레임에서 저음의 반음 간격까지 구분되도록)
+def fft_size(frame_length):
+    return 1 << (2 * frame_length - 1).bit_length()
+
+# rfft 빈 -> 피치 클래스 (12 × 빈) 행렬. 각 빈은 가장 가까운 반음의 피치 클래스에 더해진다
+@functools.lru_cache(maxsize=16)
+def chroma_filter(n_fft, sample_rate, a4=A4_FREQ, freq_range=FREQ_RANGE):
+    freqs = np.fft.rfftfreq(n_fft, 1 / sample_rate)
+    low, high = freq_range
+    in_range = (freqs >= low) & (freqs <= high)
+    pitch_classes = np.rint(69 + 12 * np.log2(freqs[in_range] / a4)).astype(np.intp) % 12
+    matrix = np.zeros((12, len(freqs)), dtype=np.float32)
+    matrix[pitch_classes, np.flatnonzero(in_range)] = 1
+    matrix.setflags(write=False)
+    return matrix
+
+@functools.lru_cache(maxsize=16)
+def hann_window(frame_length):
+    window = np.hanning(frame_length).astype(np.float32)
+    window.setflags(write=False)
+    return window
+
+# (프레임 × 프레임 길이) 배열의 크로마 (프레임 × 12)와 프레임별 RMS. 모든 프레임을 한 번의 rfft / 행렬곱으로 처리
+def frame_chroma(frames, sample_rate, a4=A4_FREQ):
+    frame_length = frames.shape[1]
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    n_fft = fft_size(frame_length)
+    spectrum = np.abs(np.fft.rfft(frames * hann_window(frame_length), n=n_fft, axis=1)).astype(np.float32)
+    return spectrum @ chroma_filter(n_fft, sample_rate, a4).T, rms
+
+# 겹치지 않는 프레임별 크로마그램과 RMS
+def chromagram(samples, sample_rate, frame_seconds=FRAME_SECONDS, a4=A4_FREQ):
+    frame_length = int(sample_rate * frame_seconds)
+    frame_count = len(samples) // frame_length
+    frames = np.asarray(samples[:frame_count * frame_length], dtype=np.float32).reshape(frame_count, frame_length)
+    return frame_chroma(frames, sample_rate, a4)
+
+# 코드 템플릿 (템플릿 × 12, 단위 벡터)과 각 템플릿의 (근음, 코드 종류)
+@functools.lru_cache(maxsize=8)
+def chord_templates(types=tuple(chord_types)):
+    labels = [(root, chord_type) for root in NOTE_NAMES for chord_type in types]
+    templates = np.zeros((len(labels), 12), dtype=np.float32)
+    for i, (root, chord_type) in enumerate(labels):
+        templates[i, [(NOTE_INDEX[root] + interval) % 12 for interval in CHORD_INTERVALS[chord_type]]] = 1
+    templates /= np.linalg.norm(templates, axis=1, keepdims=True)
+    templates.setflags(write=False)
+    return templates, labels
+
+# 크로마 벡터(들)와 모든 템플릿의 코사인 유사도 (... × 템플릿)
+def template_scores(chroma, types=tuple(chord_types)):
+    templates, _ = chord_templates(types)
+    norms = np.linalg.norm(chroma, axis=-1, keepdims=True)
+    return (chroma / np.maximum(norms, 1e-12)) @ templates.T
+
+# 프레임마다 가장 가까운 코드. 조용한 프레임은 None
+def detect_frames(samples, sample_rate, frame_seconds=FRAME_SECONDS, types=tuple(chord_types)):
+    chroma, rms = chromagram(samples, sample_rate, frame_seconds)
+    scores = template_scores(chroma, types)
+    best = scores.argmax(axis=1)
+    _, labels = chord_templates(types)
+    return [labels[i] + (float(scores[frame, i]),) if rms[frame] >= SILENCE_RMS else None
+            for frame, i in enumerate(best)]
+
+# 소리가 나는 프레임의 크로마를 모두 더해 클립 전체에서 가장 가까운 코드 하나를 (근음, 코드 종류, 유사도)로 반환
+# (아르페지오처럼 음이 차례로 나오는 경우도 합쳐서 판정됨)
+def detect_chord(samples, sample_rate, frame_seconds=FRAME_SECONDS, types=tuple(chord_types)):
+    chroma, rms = chromagram(samples, sample_rate, frame_seconds)
+    voiced = rms >= SILENCE_RMS
+    if not voiced.any():
+        return None
+    scores = template_scores(chroma[voiced].sum(axis=0), types)
+    _, labels = chord_templates(types)
+    best = int(scores.argmax())
+    return labels[best] + (float(scores[best]),)
+
+# 연주한 오디오가 기대한 코드인지 판정. Diminished7 / aug처럼 근음만 다르고 음 집합이 같은 코드도 정답으로 본다
+def check_chord(samples, sample_rate, key, chord_type, frame_seconds=FRAME_SECONDS, tolerance=0.02):
+    chroma, rms = chromagram(samples, sample_rate, frame_seconds)
+    voiced = rms >= SILENCE_RMS
+    if not voiced.any():
+        return {'detected': None, 'correct': False, 'score': 0.0}
+    types = tuple(chord_types) if chord_type in chord_types else tuple(chord_types) + (chord_type,)
+    scores = template_scores(chroma[voiced].sum(axis=0), types)
+    _, labels = chord_templates(types)
+    best = int(scores.argmax())
+    expected = float(scores[labels.index((key, chord_type))])
+    return {
+        'detected': labels[best],
+        'correct': bool(expected >= scores[best] - tolerance),
+        'score': expected,
+    }
+
+# WAV를 읽지 않고 메모리 매핑해 (샘플 × 채널) 배열과 샘플레이트를 반환. 몇 분짜리 녹음도 실제로 접근한 부분만 읽힌다
+# WAVE_FORMAT_EXTENSIBLE의 SubFormat GUID는 앞 2바이트가 형식 코드이고 나머지는 이 고정 값
+WAVE_FORMAT_PCM = 1
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+KSDATAFORMAT_SUFFIX = b'\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+
+# fmt 청크에서 (형식 코드, 채널 수, 샘플레이트, 비트 수). 확장 형식은 SubFormat에 적힌 실제 형식 코드로 바꾼다
+def parse_wav_format(chunk):
+    if len(chunk) < 16:
+        raise ValueError('WAV fmt chunk is too short')
+    audio_format, channels, sample_rate, _, _, bits = struct.unpack('<HHIIHH', chunk[:16])
+    if audio_format == WAVE_FORMAT_EXTENSIBLE:
+        if len(chunk) < 40 or struct.unpack('<H', chunk[16:18])[0] < 22 or chunk[26:40] != KSDATAFORMAT_SUFFIX:
+            raise ValueError('WAV extensible format without a valid SubFormat')
+        audio_format = struct.unpack('<H', chunk[24:26])[0]
+    return audio_format, channels, sample_rate, bits
+
+def open_wav_memmap(path):
+    with open(path, 'rb') as wav_file:
+        riff, _, wave_id = struct.unpack('<4sI4s', wav_file.read(12))
+        if riff != b'RIFF' or wave_id != b'WAVE':
+            raise ValueError('not a PCM WAV file')
+        wav_format = None
+        while True:
+            header = wav_file.read(8)
+            if len(header) < 8:
+                raise ValueError('WAV file has no data chunk')
+            chunk_id, chunk_size = struct.unpack('<4sI', header)
+            if chunk_id == b'fmt ':
+                wav_format = parse_wav_format(wav_file.read(chunk_size))
+                wav_file.seek(chunk_size % 2, 1)
+            elif chunk_id == b'data':
+                data_offset = wav_file.tell()
+                break
+            else:
+                wav_file.seek(chunk_size + chunk_size % 2, 1)  # RIFF 청크는 2바이트 단위로 정렬
+    if wav_format is None:
+        raise ValueError('WAV file has no fmt chunk before its data')
+    # 정수 PCM만 지원 (float WAV를 정수로 매핑하면 값이 전부 깨짐)
+    audio_format, channels, sample_rate, bits = wav_format
+    if audio_format != WAVE_FORMAT_PCM or bits not in (8, 16, 32) or not channels:
+        raise ValueError(f"unsupported WAV format: format {audio_format}, {bits} bits (integer PCM only)")
+    dtype = np.dtype({8: 'u1', 16: '<i2', 32: '<i4'}[bits])
+    frame_count = min(chunk_size, os.path.getsize(path) - data_offset) // (dtype.itemsize * channels)
+    samples = np.memmap(path, dtype=dtype, mode='r', offset=data_offset, shape=(frame_count, channels))
+    return samples, sample_rate
+
+# 메모리 매핑한 정수 샘플 일부를 모노 float32 [-1, 1]로 변환
+def to_mono_float(samples):
+    mono = samples.mean(axis=1, dtype=np.float32) if samples.shape[1] > 1 else samples[:, 0].astype(np.float32)
+    if samples.dtype == np.uint8:
+        mono -= 128
+    mono /= 2 ** (samples.dtype.itemsize * 8 - 1)
+    return mono
+
+# 긴 녹음의 겹치는 프레임(hop 간격)에 대해 프레임별 (크로마, RMS)를 batch_frames개씩 내보낸다.
+# 배치마다 필요한 샘플 구간만 float로 변환하고, 프레임은 sliding_window_view로 복사 없이 만든다
+def stream_chroma(samples, sample_rate, frame_seconds=FRAME_SECONDS, hop_seconds=HOP_SECONDS,
+                  batch_frames=BATCH_FRAMES, a4=A4_FREQ):
+    frame_length = int(sample_rate * frame_seconds)
+    hop = int(sample_rate * hop_seconds)
+    frame_count = max(0, (len(samples) - frame_length) // hop + 1)
+    for first in range(0, frame_count, batch_frames):
+        count = min(batch_frames, frame_count - first)
+        block = to_mono_float(samples[first * hop:(first + count - 1) * hop + frame_length])
+        frames = sliding_window_view(block, frame_length)[::hop]
+        yield frame_chroma(frames, sample_rate, a4)
+
+# 녹음 전체의 코드 타임라인. 각 프레임은 직전 smoothing_seconds 동안의 크로마 합으로 판정하고, 같은 코드가 이어지는
+# 프레임을 합쳐 (시작 초, 끝 초, 근음, 코드 종류) 구간 목록으로 반환한다. min_segment_seconds보다 짧은 구간은
+# 앞 구간에 흡수하며, 소리가 없는 구간은 목록에 넣지 않음
+def chord_timeline(path, frame_seconds=FRAME_SECONDS, hop_seconds=HOP_SECONDS, batch_frames=BATCH_FRAMES,
+                   types=tuple(chord_types), smoothing_seconds=SMOOTHING_SECONDS,
+                   min_segment_seconds=MIN_SEGMENT_SECONDS):
+    samples, sample_rate = open_wav_memmap(path)
+    _, labels = chord_templates(types)
+    window = max(1, round(smoothing_seconds / hop_seconds))
+    history = np.zeros((window - 1, 12), dtype=np.float32)  # 앞 배치의 마지막 window - 1 프레임
+    segments = []  # [시작 프레임, 끝 프레임(미포함), 레이블 번호 또는 None]
+    frame = 0
+    for chroma, rms in stream_chroma(samples, sample_rate, frame_seconds, hop_seconds, batch_frames):
+        padded = np.concatenate([history, chroma])
+        # 구간 합도 sliding_window_view로 복사 없이 (프레임 × 12 × window) 뷰를 만들어 더함
+        smoothed = sliding_window_view(padded, window, axis=0).sum(axis=-1)
+        history = padded[len(padded) - (window - 1):]
+        best = template_scores(smoothed, types).argmax(axis=1)
+        for label, voiced in zip(best.tolist(), (rms >= SILENCE_RMS).tolist()):
+            label = label if voiced else None
+            if segments and segments[-1][2] == label:
+                segments[-1][1] = frame + 1
+            else:
+                segments.append([frame, frame + 1, label])
+            frame += 1
+
+    min_frames = max(1, round(min_segment_seconds / hop_seconds))
+    merged = []
+    for segment in segments:
+        if merged and (segment[1] - segment[0] < min_frames or merged[-1][2] == segment[2]):
+            merged[-1][1] = segment[1]
+        else:
+            merged.append(segment)
+
+    # 프레임 i는 i * hop초에 시작하므로 구간 [start, end)는 start * hop ~ end * hop초 (구간끼리 겹치지 않음).
+    # 판정이 직전 구간의 평균이라 반 구간만큼 늦으므로 그만큼 앞당긴다
+    delay = (window - 1) / 2 * hop_seconds
+    return [(max(0.0, start * hop_seconds - delay), max(0.0, end * hop_seconds - delay)) + labels[label]
+            for start, end, label in merged if label is not None]
+
+# 기대한 타임라인 [(시작 초, 끝 초, 근음, 코드 종류), ...] 중 같은 음 집합의 코드가 검출된 시간의 비율
+def timeline_agreement(timeline, expected):
+    def chord_mask(root, chord_type):
+        return pitch_class_mask(NOTE_INDEX[root] + interval for interval in CHORD_INTERVALS[chord_type])
+
+    matched = total = 0.0
+    for start, end, root, chord_type in expected:
+        total += end - start
+        mask = chord_mask(root, chord_type)
+        for detected_start, detected_end, detected_root, detected_type in timeline:
+            if detected_start < end and detected_end > start and chord_mask(detected_root, detected_type) == mask:
+                matched += min(end, detected_end) - max(start, detected_start)
+    return matched / total if total else 0.0
@@ -0,0 +1,302 @@
+import base64
+import contextlib
+import logging
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from chordplay.analysis import check_chord, read_wav
+from chordplay.cache import AudioCache
+from chordplay.client_synth import client_synth_player
+from chordplay.metrics import METRICS, start_metrics_log, start_metrics_server, timer
+from chordplay.pack import AudioPack
+from chordplay.render import AUDIO_BITRATE, AUDIO_CODEC, answer_clip_key, render_answer_clip, synthesis_settings
+from chordplay.synth import A4_FREQ, SAMPLE_RATE
+from chordplay.theory import chord_name, chord_types, generate_correct_answer, iter_inversion_arpeggio, keys
+
+STYLES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'styles')
+
+logger = logging.getLogger(__name__)
+
+# CHORDPLAY_LOG_LEVEL=INFO 로 실행하면 상호작용마다 실행 시간이 로그로 출력됨
+if os.environ.get('CHORDPLAY_LOG_LEVEL'):
+    logging.basicConfig()
+    logging.getLogger('chordplay').setLevel(os.environ['CHORDPLAY_LOG_LEVEL'].upper())
+
+# 재생 방식 (CHORDPLAY_PLAYBACK): server = 서버에서 렌더링한 오디오 전송, client = 브라우저에서 Web Audio로 합성
+PLAYBACK_MODE = os.environ.get('CHORDPLAY_PLAYBACK', 'server')
+
+# 이미지를 base64로 인코딩하는 함수
+def img_to_base64(img_path):
+    with open(img_path, "rb") as img_file:
+        return base64.b64encode(img_file.read()).decode('utf-8')
+
+def read_stylesheet(name):
+    with open(os.path.join(STYLES_DIR, f'{name}.css'), encoding='utf-8') as css_file:
+        return css_file.read()
+
+# 로고는 각 앱 폴더의 static/logo.png. server.enableStaticServing이 켜져 있으면
+# 브라우저가 app/static/logo.png를 직접 받아 캐시하므로 rerun마다 이미지를 다시 보내지 않음
+def use_static_logo(app_dir):
+    return bool(st.get_option('server.enableStaticServing')) and os.path.isfile(os.path.join(app_dir, 'static', 'logo.png'))
+
+# 로고 URL과 스타일시트 HTML을 프로세스 전체에서 한 번만 만들어 둔다
+@st.cache_resource
+def load_page_assets(app_dir, stylesheet, use_static):
+    if use_static:
+        logo_url = 'app/static/logo.png'
+    else:
+        logo_url = f"data:image/png;base64,{img_to_base64(os.path.join(app_dir, 'static', 'logo.png'))}"
+    # (스타일시트는 들여쓰기 없이 넣어야 마크다운 코드 블록으로 처리되지 않음)
+    head_html = (f"<style>\n{read_stylesheet(stylesheet)}</style>\n\n"
+                 "<!-- 로고 이미지 추가 -->\n"
+                 f'<img src="{logo_url}" class="logo-img">')
+    return logo_url, head_html
+
+# 캐시 용량은 CHORDPLAY_CACHE_MB 환경 변수로 설정 (기본 64MB)
+@st.cache_resource
+def get_audio_cache():
+    max_megabytes = float(os.environ.get('CHORDPLAY_CACHE_MB', 64))
+    cache = AudioCache(int(max_megabytes * 1024 * 1024))
+
+    def cache_metrics():
+        stats = cache.stats()
+        return [
+            ('cache_hits_total', 'counter', stats['hits']),
+            ('cache_misses_total', 'counter', stats['misses']),
+            ('cache_entries', 'gauge', stats['entries']),
+            ('cache_bytes', 'gauge', stats['bytes']),
+        ]
+
+    METRICS.add_collector(cache_metrics)
+    return cache
+
+# 지표 내보내기 (프로세스당 한 번 시작)
+#   CHORDPLAY_METRICS_PORT=9464         -> http://127.0.0.1:9464/metrics 에서 Prometheus 형식으로 제공
+#   CHORDPLAY_METRICS_LOG=metrics.prom  -> CHORDPLAY_METRICS_INTERVAL(기본 15)초마다 파일에 기록
+@st.cache_resource
+def start_metrics_export():
+    if os.environ.get('CHORDPLAY_METRICS_PORT'):
+        start_metrics_server(int(os.environ['CHORDPLAY_METRICS_PORT']))
+    if os.environ.get('CHORDPLAY_METRICS_LOG'):
+        start_metrics_log(os.environ['CHORDPLAY_METRICS_LOG'], float(os.environ.get('CHORDPLAY_METRICS_INTERVAL', 15)))
+    return True
+
+# 서버 프로세스 전체가 공유하는 프리페치 스레드 풀 (CHORDPLAY_PREFETCH_WORKERS, 기본 2)
+@st.cache_resource
+def get_prefetch_pool():
+    max_workers = int(os.environ.get('CHORDPLAY_PREFETCH_WORKERS', 2))
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='chordplay-prefetch')
+
+# python -m chordplay.prerender로 만든 오디오 팩 (CHORDPLAY_AUDIO_PACK). 팩에 있는 클립은 합성 없이 파일에서 잘라 보냄.
+# 팩을 만들 때의 합성 설정(파형, 샘플 뱅크, A4, dtype)이 지금 앱과 다르면 경고를 남기고 팩을 쓰지 않는다
+@st.cache_resource
+def get_audio_pack():
+    path = os.environ.get('CHORDPLAY_AUDIO_PACK')
+    if not path:
+        return None
+    pack = AudioPack(path)
+    pack_settings = pack.params.get('synthesis')
+    if pack_settings != synthesis_settings():
+        logger.warning('ignoring audio pack %s: built with synthesis settings %s, but this app uses %s',
+                       path, pack_settings, synthesis_settings())
+        return None
+    return pack
+
+def answer_job_key(key, chord_type, include_inversions, bpm):
+    if include_inversions:
+        return (key, chord_type, 'arpeggio', bpm)
+    return (key, chord_type, 'chord', None)
+
+# 팩에 저장된 클립 키 (팩을 만들 때와 같은 샘플레이트 / 코덱 / 비트레이트 / 길이로 실행해야 일치)
+def packed_clip_key(job_key, chord_duration, subdivision):
+    return answer_clip_key(*job_key, SAMPLE_RATE, chord_duration, subdivision, AUDIO_CODEC, AUDIO_BITRATE)
+
+# 현재 선택에서 재생될 가능성이 높은 변형(현재 모드 우선, 다른 모드 다음)을 백그라운드에서 미리 렌더링해
+# 세션 상태에 Future로 보관. 선택이 바뀌어 필요 없어진 작업은 아직 시작 전이면 취소
+def prefetch_answer_clips(key, chord_type, include_inversions, bpm, chord_duration, subdivision):
+    wanted = [
+        answer_job_key(key, chord_type, include_inversions, bpm),
+        answer_job_key(key, chord_type, not include_inversions, bpm),
+    ]
+    jobs = st.session_state.setdefault('prefetch_jobs', {})
+    for job_key in list(jobs):
+        if job_key not in wanted:
+            jobs.pop(job_key).cancel()
+
+    pool = get_prefetch_pool()
+    cache = get_audio_cache()
+    pack = get_audio_pack()
+    for job_key in wanted:
+        if pack is not None and packed_clip_key(job_key, chord_duration, subdivision) in pack:
+            continue
+        if job_key not in jobs:
+            jobs[job_key] = pool.submit(render_answer_clip, *job_key, cache,
+                                        chord_duration=chord_duration, subdivision=subdivision)
+
+# 팩에 있으면 팩에서, 프리페치된 결과가 있으면 그대로 쓰고(진행 중이면 완료를 기다림), 없으면 직접 렌더링
+def get_answer_clip(key, chord_type, include_inversions, bpm, chord_duration, subdivision):
+    job_key = answer_job_key(key, chord_type, include_inversions, bpm)
+    pack = get_audio_pack()
+    if pack is not None:
+        clip = pack.get(packed_clip_key(job_key, chord_duration, subdivision))
+        if clip is not None:
+            return clip
+    job = st.session_state.get('prefetch_jobs', {}).get(job_key)
+    if job is not None and not job.cancelled():
+        return job.result()
+    return render_answer_clip(*job_key, get_audio_cache(), chord_duration=chord_duration, subdivision=subdivision)
+
+# 실행 단위(전체 스크립트 또는 fragment)별 실행 시간을 세션 상태(run_timings)와 로그에 기록.
+# fragment만 다시 실행되는 조작(슬라이더, 체크박스, 재생)도 여기를 거치므로 활성 세션 표시도 여기서 갱신
+@contextlib.contextmanager
+def timed_run(region):
+    ctx = get_script_run_ctx()
+    if ctx is not None:
+        METRICS.touch_session(ctx.session_id)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        st.session_state.setdefault('run_timings', {})[region] = elapsed_ms
+        logger.info('%s run took %.1f ms', region, elapsed_ms)
+
+# 아래 fragment들은 각자 안의 위젯이 바뀔 때 해당 영역만 다시 실행/전송된다
+
+# 새로고침 버튼과 Key / 코드 유형 표시
+@st.fragment
+def chord_card():
+    with timed_run('chord_card'):
+        # 새로고침 버튼
+        st.markdown('<div class="refresh-button-container">', unsafe_allow_html=True)
+        if st.button('🔄', key='refresh'):
+            st.session_state.key = random.choice(keys)
+            st.session_state.chord_type = random.choice(chord_types)
+            st.session_state.chord_notes = generate_correct_answer(st.session_state.key, st.session_state.chord_type)
+            # 새 코드는 재생/구성음 영역에도 반영되어야 하므로 앱 전체를 다시 실행
+            st.rerun()
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        # Key와 코드 유형 표시 부분
+        st.markdown(f"""
+        <div class="center-container">
+            <div class="key-style">{st.session_state.key}</div>
+            <div class="chord-type-style">{st.session_state.chord_type}</div>
+        </div>
+        """, unsafe_allow_html=True)
+
+# Inversion Arpeggio 체크박스, BPM 슬라이더, 재생 버튼
+@st.fragment
+def answer_player(chord_duration, subdivision):
+    with timed_run('answer_player'):
+        # Inversion Arpeggio 체크박스
+        include_inversions = st.checkbox('Inversion Arpeggio', key='include_inversions')
+
+        # BPM 슬라이더 (더 작게 구현, 라벨 제거)
+        bpm = st.slider('BPM', 60, 240, st.session_state.bpm, format="%d", step=1, label_visibility='collapsed')
+        st.session_state.bpm = bpm
+
+        if PLAYBACK_MODE == 'server':
+            prefetch_answer_clips(st.session_state.key, st.session_state.chord_type, include_inversions, bpm,
+                                  chord_duration, subdivision)
+
+        # 코드 재생 버튼
+        if st.button('Answer Generation', key='play_chord'):
+            mode = 'arpeggio' if include_inversions else 'chord'
+            if PLAYBACK_MODE == 'client':
+                # 브라우저 합성: 음 목록과 BPM만 전송
+                chord_notes = st.session_state.chord_notes
+                if include_inversions:
+                    chord_notes = iter_inversion_arpeggio(chord_notes)
+                client_synth_player([note.midi for note in chord_notes], mode, bpm, duration=chord_duration,
+                                    subdivision=subdivision, a4=A4_FREQ)
+            else:
+                audio_bytes, mime = get_answer_clip(st.session_state.key, st.session_state.chord_type,
+                                                    include_inversions, bpm, chord_duration, subdivision)
+                with timer('audio_handoff'):
+                    st.audio(audio_bytes, format=mime)
+
+# 구성음 확인 토글과 구성음 표시
+@st.fragment
+def notes_panel():
+    with timed_run('notes_panel'):
+        # 구성음 확인 토글
+        show_notes = st.toggle('Show Notes', key='toggle_show_notes')
+
+        # 구성음 표시
+        if show_notes:
+            notes_text = ' '.join([note.name for note in st.session_state.chord_notes])
+            st.write(f"Notes: {notes_text}")
+
+# 연주한 코드 확인: 마이크 녹음(st.audio_input이 있는 Streamlit 버전) 또는 WAV 업로드를 현재 코드와 비교
+@st.fragment
+def chord_checker():
+    with timed_run('chord_checker'):
+        recording = None
+        if hasattr(st, 'audio_input'):
+            recording = st.audio_input('Play the chord', key='chord_recording')
+        upload = st.file_uploader('Upload a WAV recording', type=['wav'], key='chord_upload')
+        clip = recording or upload
+        if clip is None:
+            return
+
+        try:
+            samples, sample_rate = read_wav(clip)
+        except ValueError as error:
+            st.error(f"Could not read the recording: {error}")
+            return
+        with timer('analysis'):
+            result = check_chord(samples, sample_rate, st.session_state.key, st.session_state.chord_type)
+
+        if result['detected'] is None:
+            st.warning("No sound detected in the recording.")
+        elif result['correct']:
+            st.success(f"Correct! {chord_name(st.session_state.key, st.session_state.chord_type)}")
+        else:
+            st.error(f"Heard {chord_name(*result['detected'])}")
+
+# ChordPlay 화면 전체를 그린다. 앱마다 다른 부분(앱 폴더, 스타일, 블록 코드 길이, 아르페지오 음 길이)만 인자로 받음
+def run_app(app_dir, stylesheet='light', chord_duration=2, subdivision=2):
+    with timed_run('app'):
+        start_metrics_export()
+        get_audio_cache()
+        logo_url, head_html = load_page_assets(app_dir, stylesheet, use_static_logo(app_dir))
+
+        # 파비콘 설정
+        st.set_page_config(page_title="ChordPlay", page_icon=logo_url, layout="wide")
+
+        # CSS를 사용하여 폰트와 배경색 설정
+        st.markdown(head_html, unsafe_allow_html=True)
+
+        # 세션 상태 초기화
+        if 'key' not in st.session_state:
+            st.session_state.key = random.choice(keys)
+
+        if 'chord_type' not in st.session_state:
+            st.session_state.chord_type = random.choice(chord_types)
+
+        if 'chord_notes' not in st.session_state:
+            st.session_state.chord_notes = generate_correct_answer(st.session_state.key, st.session_state.chord_type)
+
+        if 'bpm' not in st.session_state:
+            st.session_state.bpm = 120
+
+        # Streamlit 앱 UI (헤더 텍스트 변경 및 크기 축소)
+        st.markdown("<h3 style='text-align: center; font-family: \"Times Newer Roman\", Times, serif;'>ChordPlay</h3>", unsafe_allow_html=True)
+
+        # 전체 레이아웃을 3개의 열로 나누어 중앙 정렬
+        col1, col2, col3 = st.columns([1, 2, 1])
+
+        with col2:
+            chord_card()
+            answer_player(chord_duration, subdivision)
+            notes_panel()
+            chord_checker()
+
+        # 저작권 정보 추가
+        st.markdown('<div class="copyright">ⓒ 2024 Youjung Huh All Rights Reserved.</div>', unsafe_allow_html=True)
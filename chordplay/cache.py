@@ -0,0 +1,53 @@
+import threading
+from collections import OrderedDict
+
+# 캐시 항목의 크기: NumPy 배열은 nbytes, 인코딩 결과 (bytes, MIME)는 데이터 길이
+def cache_entry_size(value):
+    if isinstance(value, tuple):
+        return len(value[0])
+    return value.nbytes
+
+# 렌더링된 오디오를 바이트 예산 안에서 보관하는 LRU 캐시 (세션 간 공유)
+class AudioCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, cache_key, render):
+        with self._lock:
+            if cache_key in self._items:
+                self._items.move_to_end(cache_key)
+                self.hits += 1
+                return self._items[cache_key]
+            self.misses += 1
+
+        # 합성은 락 밖에서 수행해 다른 세션을 막지 않음
+        audio_data = render()
+        if hasattr(audio_data, 'setflags'):
+            audio_data.setflags(write=False)
+        size = cache_entry_size(audio_data)
+        if size > self.max_bytes:
+            return audio_data
+
+        with self._lock:
+            if cache_key not in self._items:
+                self._items[cache_key] = audio_data
+                self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.current_bytes -= cache_entry_size(evicted)
+        return audio_data
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._items),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
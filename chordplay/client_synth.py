@@ -0,0 +1,22 @@
+import os
+
+import streamlit.components.v1 as components
+
+# 브라우저에서 Web Audio로 합성하는 재생 컴포넌트. 서버는 MIDI 번호 목록만 보낸다
+_client_synth = components.declare_component(
+    'client_synth',
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'client_synth_frontend'),
+)
+
+# mode는 'chord'(duration초 동안 동시에) 또는 'arpeggio'(한 박을 subdivision개로 나눈 길이로 차례로)
+def client_synth_player(notes, mode, bpm, duration=2, subdivision=2, a4=440.0, key=None):
+    return _client_synth(
+        notes=[int(note) for note in notes],
+        mode=mode,
+        bpm=bpm,
+        duration=duration,
+        subdivision=subdivision,
+        a4=a4,
+        key=key,
+        default=None,
+    )
@@ -0,0 +1,42 @@
+import functools
+import io
+import shutil
+import subprocess
+import wave
+
+# 코덱별 ffmpeg 설정: (컨테이너 포맷, 인코더, MIME 타입, 추가 옵션)
+CODECS = {
+    'opus': ('ogg', 'libopus', 'audio/ogg', ['-ar', '48000']),  # libopus는 48kHz 입력만 받음
+    'mp3': ('mp3', 'libmp3lame', 'audio/mpeg', []),
+    'aac': ('adts', 'aac', 'audio/aac', []),
+}
+
+def audio_to_wav_bytes(audio_data, sample_rate=44100):
+    buffer = io.BytesIO()
+    with wave.open(buffer, 'wb') as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 2 bytes per sample
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(audio_data.astype('<i2', copy=False).tobytes())
+    return buffer.getvalue()
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_available():
+    return shutil.which('ffmpeg') is not None
+
+# int16 모노 오디오를 압축 포맷으로 인코딩해 (bytes, MIME 타입)을 반환.
+# 'wav'를 고르거나 ffmpeg가 없으면 무압축 WAV로 대체
+def encode_audio(audio_data, sample_rate=44100, codec='mp3', bitrate='64k'):
+    if codec == 'wav' or not ffmpeg_available():
+        return audio_to_wav_bytes(audio_data, sample_rate), 'audio/wav'
+
+    container, encoder, mime, extra_args = CODECS[codec]
+    command = [
+        'ffmpeg', '-hide_banner', '-loglevel', 'error',
+        '-f', 's16le', '-ar', str(sample_rate), '-ac', '1', '-i', 'pipe:0',
+        '-c:a', encoder, '-b:a', bitrate, *extra_args,
+        '-f', container, 'pipe:1',
+    ]
+    result = subprocess.run(command, input=audio_data.astype('<i2', copy=False).tobytes(),
+                            capture_output=True, check=True)
+    return result.stdout, mime
@@ -0,0 +1,126 @@
+# 숙제용 연습 문제 묶음 내보내기. seed로 문제를 뽑고(같은 seed면 같은 문제), 문제마다 WAV와 표준 MIDI 파일을
+# 프로세스 풀에서 만들어 정답표(answers.json)와 함께 zip으로 묶는다. 완성된 파일부터 바로 zip에 쓰므로
+# 압축 파일 전체를 메모리에 들고 있지 않으며, 탐색이 안 되는 출력(HTTP 응답, 표준 출력)에도 쓸 수 있다
+#   python -m chordplay.exercises homework.zip --count 30 --group sevenths --seed 7
+import argparse
+import collections
+import json
+import os
+import random
+import struct
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from chordplay.encoder import audio_to_wav_bytes
+from chordplay.render import synthesize_answer_audio
+from chordplay.synth import SAMPLE_RATE
+from chordplay.theory import chord_types, generate_correct_answer, generate_inversions, keys
+
+# 출제 범위
+CHORD_GROUPS = {
+    'all': chord_types,
+    'triads': ['Major', 'minor', 'sus4', 'aug', 'dim'],
+    'sevenths': ['Major7', 'minor7', 'Dominant7', 'Diminished7', 'Half Diminished7'],
+}
+
+MIDI_DIVISION = 480  # 4분음표당 틱 수
+MIDI_VELOCITY = 80
+
+def pick_exercises(count, group='all', seed=None):
+    rng = random.Random(seed)
+    types = CHORD_GROUPS[group]
+    return [(rng.choice(keys), rng.choice(types)) for _ in range(count)]
+
+def exercise_notes(key, chord_type, mode):
+    chord_notes = generate_correct_answer(key, chord_type)
+    return generate_inversions(chord_notes) if mode == 'arpeggio' else chord_notes
+
+# MIDI 가변 길이 수량 (7비트씩, 마지막 바이트를 뺀 나머지는 최상위 비트 1)
+def midi_varlen(value):
+    data = [value & 0x7F]
+    value >>= 7
+    while value:
+        data.append(0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(reversed(data))
+
+# 트랙 하나짜리 SMF type 0. 블록 코드는 모든 음을 chord_duration초 동안 동시에, 아르페지오는 한 박을 subdivision으로 나눈 길이로 차례로
+def midi_file(notes, mode, bpm, chord_duration=2, subdivision=2):
+    events = [(0, b'\xff\x51\x03' + struct.pack('>I', round(60_000_000 / bpm))[1:])]  # 템포
+    midi = [note.midi for note in notes]
+    if mode == 'arpeggio':
+        length = MIDI_DIVISION // subdivision
+        for pitch in midi:
+            events.append((0, bytes([0x90, pitch, MIDI_VELOCITY])))
+            events.append((length, bytes([0x80, pitch, 0])))
+    else:
+        length = round(chord_duration * bpm / 60 * MIDI_DIVISION)
+        events += [(0, bytes([0x90, pitch, MIDI_VELOCITY])) for pitch in midi]
+        events += [(length if i == 0 else 0, bytes([0x80, pitch, 0])) for i, pitch in enumerate(midi)]
+    events.append((0, b'\xff\x2f\x00'))  # 트랙 끝
+    track = b''.join(midi_varlen(delta) + event for delta, event in events)
+    return (b'MThd' + struct.pack('>IHHH', 6, 0, 1, MIDI_DIVISION)
+            + b'MTrk' + struct.pack('>I', len(track)) + track)
+
+# 작업 프로세스에서 실행: 문제 하나의 (WAV bytes, MIDI bytes). 클립마다 한 번만 렌더링하므로 캐시를 거치지 않음
+def render_exercise(job):
+    key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision = job
+    audio_data = synthesize_answer_audio(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision)
+    midi_data = midi_file(exercise_notes(key, chord_type, mode), mode, bpm, chord_duration, subdivision)
+    return audio_to_wav_bytes(audio_data, sample_rate), midi_data
+
+# pool.map과 같지만 동시에 진행 중인 작업을 window개로 제한해, zip에 쓰기 전의 결과가 메모리에 쌓이지 않게 한다
+def bounded_map(pool, function, jobs, window):
+    pending = collections.deque()
+    for job in jobs:
+        pending.append(pool.submit(function, job))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+# file은 경로나 쓰기용 파일 객체. WAV는 압축해도 거의 줄지 않으므로 그대로 저장하고 MIDI / 정답표만 압축
+def write_exercise_zip(file, items, mode='chord', bpm=120, sample_rate=SAMPLE_RATE, chord_duration=2, subdivision=2,
+                       workers=None):
+    jobs = [(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision) for key, chord_type in items]
+    answers = []
+    window = 4 * (workers or os.cpu_count() or 1)
+    with zipfile.ZipFile(file, 'w') as archive, ProcessPoolExecutor(max_workers=workers) as pool:
+        for number, ((key, chord_type), (wav_data, midi_data)) in enumerate(
+                zip(items, bounded_map(pool, render_exercise, jobs, window)), start=1):
+            name = f'{number:03d}'
+            archive.writestr(f'{name}.wav', wav_data, compress_type=zipfile.ZIP_STORED)
+            archive.writestr(f'{name}.mid', midi_data, compress_type=zipfile.ZIP_DEFLATED)
+            answers.append({
+                'number': number, 'audio': f'{name}.wav', 'midi': f'{name}.mid', 'key': key, 'chord_type': chord_type,
+                'notes': [str(note) for note in exercise_notes(key, chord_type, mode)],
+            })
+        answer_key = {'mode': mode, 'bpm': bpm, 'sample_rate': sample_rate, 'exercises': answers}
+        archive.writestr('answers.json', json.dumps(answer_key, ensure_ascii=False, indent=1),
+                         compress_type=zipfile.ZIP_DEFLATED)
+    return len(answers)
+
+def main():
+    parser = argparse.ArgumentParser(description='Export a ChordPlay exercise pack (WAV + MIDI + answer key) as a zip')
+    parser.add_argument('output', help="zip file to write, or '-' for stdout")
+    parser.add_argument('--count', type=int, default=30)
+    parser.add_argument('--group', choices=list(CHORD_GROUPS), default='all')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--mode', choices=['chord', 'arpeggio'], default='chord')
+    parser.add_argument('--bpm', type=int, default=120)
+    parser.add_argument('--chord-duration', type=float, default=2)
+    parser.add_argument('--subdivision', type=int, default=2)
+    parser.add_argument('--workers', type=int, help='worker processes (default: all cores)')
+    args = parser.parse_args()
+
+    items = pick_exercises(args.count, args.group, args.seed)
+    output = sys.stdout.buffer if args.output == '-' else args.output
+    start = time.perf_counter()
+    count = write_exercise_zip(output, items, args.mode, args.bpm, chord_duration=args.chord_duration,
+                               subdivision=args.subdivision, workers=args.workers)
+    print(f"wrote {count} exercises to {args.output} in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+import bisect
+import contextlib
+import cProfile
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 단계별 지연 시간 히스토그램 버킷 (초)
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# 마지막 요청 후 이 시간(초) 안에 있는 세션을 활성 세션으로 본다
+SESSION_TIMEOUT = 300
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+# 프로세스 전체의 렌더링 지표. 단계별 시간 히스토그램, 누적 카운터, 활성 세션 수를 모은다
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._sessions = {}
+        self._collectors = []
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            self._histograms.setdefault(stage, Histogram()).observe(seconds)
+
+    def inc(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    @contextlib.contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def touch_session(self, session_id):
+        with self._lock:
+            self._sessions[session_id] = time.monotonic()
+
+    def active_sessions(self):
+        cutoff = time.monotonic() - SESSION_TIMEOUT
+        with self._lock:
+            for session_id in [s for s, last_seen in self._sessions.items() if last_seen < cutoff]:
+                del self._sessions[session_id]
+            return len(self._sessions)
+
+    # collector는 [(이름, 'counter' 또는 'gauge', 값), ...]을 돌려주는 함수 (예: 캐시 적중 수)
+    def add_collector(self, collector):
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render_prometheus(self):
+        lines = []
+        with self._lock:
+            histograms = {stage: (list(h.counts), h.sum, h.count) for stage, h in self._histograms.items()}
+            counters = dict(self._counters)
+            collectors = list(self._collectors)
+
+        lines.append('# HELP chordplay_stage_seconds Time spent in each render stage.')
+        lines.append('# TYPE chordplay_stage_seconds histogram')
+        for stage, (counts, total, count) in sorted(histograms.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(BUCKETS + ('+Inf',), counts):
+                cumulative += bucket_count
+                lines.append(f'chordplay_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'chordplay_stage_seconds_sum{{stage="{stage}"}} {total}')
+            lines.append(f'chordplay_stage_seconds_count{{stage="{stage}"}} {count}')
+
+        for name, value in sorted(counters.items()):
+            lines.append(f'# TYPE chordplay_{name} counter')
+            lines.append(f'chordplay_{name} {value}')
+
+        lines.append('# TYPE chordplay_active_sessions gauge')
+        lines.append(f'chordplay_active_sessions {self.active_sessions()}')
+        for collector in collectors:
+            for name, metric_type, value in collector():
+                lines.append(f'# TYPE chordplay_{name} {metric_type}')
+                lines.append(f'chordplay_{name} {value}')
+        return '\n'.join(lines) + '\n'
+
+METRICS = MetricsRegistry()
+
+def timer(stage):
+    return METRICS.timer(stage)
+
+# 로컬 Prometheus 엔드포인트 (http://host:port/metrics). 데몬 스레드에서 동작
+def start_metrics_server(port, host='127.0.0.1', registry=METRICS):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, name='chordplay-metrics', daemon=True).start()
+    return server
+
+# 같은 내용을 interval초마다 파일에 덮어쓴다 (node_exporter textfile collector 등에서 읽을 수 있음)
+def start_metrics_log(path, interval=15, registry=METRICS):
+    def flush_forever():
+        while True:
+            time.sleep(interval)
+            temporary_path = f'{path}.tmp'
+            with open(temporary_path, 'w', encoding='utf-8') as metrics_file:
+                metrics_file.write(registry.render_prometheus())
+            os.replace(temporary_path, path)
+
+    thread = threading.Thread(target=flush_forever, name='chordplay-metrics-log', daemon=True)
+    thread.start()
+    return thread
+
+# CHORDPLAY_PROFILE=경로 를 설정하거나 request_profile()을 호출하면 다음 렌더링 한 번을 cProfile로 기록
+_profile_lock = threading.Lock()
+_profile_path = os.environ.get('CHORDPLAY_PROFILE')
+
+def request_profile(path):
+    global _profile_path
+    with _profile_lock:
+        _profile_path = path
+
+@contextlib.contextmanager
+def profile_render():
+    global _profile_path
+    with _profile_lock:
+        path, _profile_path = _profile_path, None
+    if not path:
+        yield
+        return
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
@@ -0,0 +1,51 @@
+import functools
+
+import numpy as np
+
+# 위상 누산기는 32비트 고정소수점, 테이블은 2^16 샘플 (상위 16비트로 인덱싱)
+TABLE_BITS = 16
+TABLE_SIZE = 1 << TABLE_BITS
+PHASE_BITS = 32
+
+# 파형별 배음 진폭 (첫 번째가 기본음). 높은 음에서도 나이퀴스트를 넘지 않도록 배음 수를 제한
+HARMONICS = {
+    'sine': (1.0,),
+    'saw': tuple(1 / k for k in range(1, 11)),
+    'square': tuple(1 / k if k % 2 else 0.0 for k in range(1, 11)),
+    'piano': (1.0, 0.5, 0.3, 0.25, 0.12, 0.08, 0.05, 0.03),
+}
+
+# 한 주기 파형 테이블을 배음 합성으로 만들어 파형별로 한 번만 계산
+@functools.lru_cache(maxsize=None)
+def get_wavetable(waveform, dtype=np.dtype(np.float64)):
+    phase = 2 * np.pi * np.arange(TABLE_SIZE) / TABLE_SIZE
+    table = np.zeros(TABLE_SIZE)
+    for k, amplitude in enumerate(HARMONICS[waveform], start=1):
+        if amplitude:
+            table += amplitude * np.sin(k * phase)
+    table /= np.max(np.abs(table))
+    table = table.astype(dtype)
+    table.setflags(write=False)
+    return table
+
+# 단일 주기 웨이브테이블 + 위상 누산기 오실레이터.
+# create_sine_wave와 같은 방식으로 호출하며, 호출 사이에 위상이 이어지므로 아르페지오의 음 경계에서 끊기지 않음.
+# 동시에 울리는 성부는 create_chord_audio가 성부마다 reset()으로 위상을 0으로 되돌린다
+class WavetableOscillator:
+    def __init__(self, waveform='sine'):
+        self.waveform = waveform
+        self.phase = 0
+
+    def reset(self):
+        self.phase = 0
+
+    def __call__(self, freq, duration, sample_rate=44100, dtype=np.float64):
+        length = int(sample_rate * duration)
+        increment = round(freq * (1 << PHASE_BITS) / sample_rate) % (1 << PHASE_BITS)
+        # uint32 산술은 2^32에서 자연스럽게 감기므로 별도의 mod 연산이 필요 없음
+        phases = np.arange(length, dtype=np.uint32)
+        phases *= np.uint32(increment)
+        phases += np.uint32(self.phase)
+        phases >>= np.uint32(PHASE_BITS - TABLE_BITS)
+        self.phase = (self.phase + length * increment) % (1 << PHASE_BITS)
+        return get_wavetable(self.waveform, np.dtype(dtype))[phases]
@@ -0,0 +1,60 @@
+# 미리 렌더링한 정답 클립을 담는 오디오 팩 파일.
+# 구조: [클립 데이터를 이어 붙인 영역][JSON 인덱스][트레일러: 매직, 버전, 인덱스 위치, 인덱스 길이]
+# 인덱스는 클립 키(render.answer_clip_key) -> (데이터 영역 안의 위치, 길이, MIME 타입)이고,
+# 데이터 영역은 메모리 매핑해 필요한 클립만 잘라 읽는다
+import json
+import os
+import struct
+
+import numpy as np
+
+PACK_MAGIC = b'CHORDPAK'
+PACK_VERSION = 1
+TRAILER = struct.Struct('<8sIQQ')
+
+# entries는 (클립 키, 데이터 bytes, MIME 타입)을 차례로 내보내는 iterable. 받는 대로 파일에 쓰므로
+# 전체 클립을 메모리에 모아 두지 않는다. 임시 파일에 쓴 뒤 교체하므로 실행 중인 앱이 반쯤 쓴 팩을 읽지 않음
+def write_pack(path, entries, params=None):
+    index = []
+    offset = 0
+    temporary_path = f'{path}.tmp'
+    with open(temporary_path, 'wb') as pack_file:
+        for clip_key, data, mime in entries:
+            pack_file.write(data)
+            index.append({'key': list(clip_key), 'offset': offset, 'length': len(data), 'mime': mime})
+            offset += len(data)
+        index_bytes = json.dumps({'params': params or {}, 'entries': index}).encode('utf-8')
+        pack_file.write(index_bytes)
+        pack_file.write(TRAILER.pack(PACK_MAGIC, PACK_VERSION, offset, len(index_bytes)))
+    os.replace(temporary_path, path)
+    return len(index), offset
+
+class AudioPack:
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as pack_file:
+            pack_file.seek(-TRAILER.size, os.SEEK_END)
+            magic, version, index_offset, index_length = TRAILER.unpack(pack_file.read(TRAILER.size))
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                raise ValueError(f"{path} is not a ChordPlay audio pack (version {PACK_VERSION})")
+            pack_file.seek(index_offset)
+            index = json.loads(pack_file.read(index_length))
+        self.params = index['params']
+        self.entries = {tuple(entry['key']): (entry['offset'], entry['length'], entry['mime'])
+                        for entry in index['entries']}
+        # 빈 영역은 메모리 매핑할 수 없으므로 클립이 없는 팩은 빈 배열로
+        self.data = np.memmap(path, dtype=np.uint8, mode='r', shape=(index_offset,)) if index_offset else np.empty(0, np.uint8)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, clip_key):
+        return clip_key in self.entries
+
+    # 클립 키에 해당하는 (bytes, MIME 타입). 팩에 없으면 None
+    def get(self, clip_key):
+        entry = self.entries.get(clip_key)
+        if entry is None:
+            return None
+        offset, length, mime = entry
+        return self.data[offset:offset + length].tobytes(), mime
@@ -0,0 +1,82 @@
+# 정답 카탈로그 전체(12 키 × 코드 종류, 블록 코드 + BPM별 전위 아르페지오)를 프로세스 풀로 미리 렌더링해
+# 오디오 팩 하나로 저장한다. 앱은 CHORDPLAY_AUDIO_PACK=팩 경로 로 실행하면 팩에 있는 클립을 합성 없이 바로 보낸다
+#   python -m chordplay.prerender answers.pack                                  # 루트 main.py 설정 (2초, 8분음표)
+#   python -m chordplay.prerender chordplay.pack --chord-duration 1 --subdivision 4   # ChordPlay / chord study 설정
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from chordplay.encoder import CODECS, ffmpeg_available
+from chordplay.pack import write_pack
+from chordplay.render import AUDIO_BITRATE, AUDIO_CODEC, answer_clip_key, synthesis_settings, synthesize_answer_clip
+from chordplay.synth import SAMPLE_RATE
+from chordplay.theory import chord_types, keys
+
+STANDARD_BPMS = tuple(range(60, 241, 20))  # 60, 80, ..., 240
+
+# 렌더링할 작업 목록. 작업 하나는 render_answer_clip의 인자 (키, 코드 종류, 모드, BPM, 샘플레이트, 길이, subdivision, 코덱, 비트레이트)
+def catalog_jobs(bpms=STANDARD_BPMS, sample_rate=SAMPLE_RATE, chord_duration=2, subdivision=2, codec=AUDIO_CODEC,
+                 bitrate=AUDIO_BITRATE):
+    for key in keys:
+        for chord_type in chord_types:
+            yield (key, chord_type, 'chord', None, sample_rate, chord_duration, subdivision, codec, bitrate)
+            for bpm in bpms:
+                yield (key, chord_type, 'arpeggio', bpm, sample_rate, chord_duration, subdivision, codec, bitrate)
+
+# 팩의 키에는 요청한 코덱이 들어가므로, ffmpeg가 없어 encode_audio가 WAV로 대체하는 환경에서는 만들지 않는다
+# (그대로 두면 WAV 클립이 mp3 키로 저장되어 ffmpeg가 있는 서버에서도 WAV가 나감)
+def check_codec(codec):
+    if codec != 'wav' and codec not in CODECS:
+        raise ValueError(f"unknown codec {codec!r} (choose from wav, {', '.join(CODECS)})")
+    if codec != 'wav' and not ffmpeg_available():
+        raise RuntimeError(f"ffmpeg is not installed, so {codec} clips cannot be pre-rendered (install ffmpeg or "
+                           f"use --codec wav)")
+
+# 작업 프로세스에서 실행. 클립마다 한 번만 렌더링하므로 캐시를 거치지 않음
+def render_job(job):
+    key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision, codec, bitrate = job
+    data, mime = synthesize_answer_clip(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision, codec,
+                                        bitrate)
+    expected_mime = 'audio/wav' if codec == 'wav' else CODECS[codec][2]
+    if mime != expected_mime:
+        raise RuntimeError(f"{codec} clip came back as {mime}; refusing to store it under a {codec} key")
+    return answer_clip_key(*job), data, mime
+
+# workers=None이면 CPU 코어 수만큼. 결과는 작업 순서대로 받는 즉시 팩에 기록.
+# 파형 / 샘플 뱅크 / A4 / dtype 설정은 params['synthesis']에 기록 (앱이 자기 설정과 비교)
+def prerender(path, jobs, workers=None, chunksize=4, params=None):
+    jobs = list(jobs)
+    for codec in {job[7] for job in jobs}:
+        check_codec(codec)
+    params = {**(params or {}), 'synthesis': synthesis_settings()}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return write_pack(path, pool.map(render_job, jobs, chunksize=chunksize), params)
+
+def main():
+    parser = argparse.ArgumentParser(description='Pre-render every ChordPlay answer clip into an audio pack')
+    parser.add_argument('output', help='pack file to write')
+    parser.add_argument('--bpms', type=int, nargs='+', default=list(STANDARD_BPMS))
+    parser.add_argument('--chord-duration', type=float, default=2)
+    parser.add_argument('--subdivision', type=int, default=2)
+    parser.add_argument('--sample-rate', type=int, default=SAMPLE_RATE)
+    parser.add_argument('--codec', choices=['wav', *CODECS], default=AUDIO_CODEC)
+    parser.add_argument('--bitrate', default=AUDIO_BITRATE)
+    parser.add_argument('--workers', type=int, help='worker processes (default: all cores)')
+    args = parser.parse_args()
+    try:
+        check_codec(args.codec)
+    except RuntimeError as error:
+        parser.error(str(error))
+
+    params = {
+        'bpms': args.bpms, 'chord_duration': args.chord_duration, 'subdivision': args.subdivision,
+        'sample_rate': args.sample_rate, 'codec': args.codec, 'bitrate': args.bitrate,
+    }
+    jobs = list(catalog_jobs(args.bpms, args.sample_rate, args.chord_duration, args.subdivision, args.codec,
+                             args.bitrate))
+    start = time.perf_counter()
+    count, size = prerender(args.output, jobs, args.workers, params=params)
+    print(f"wrote {count} clips ({size / 1e6:.1f} MB) to {args.output} in {time.perf_counter() - start:.1f} s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# 코드 진행 렌더러. 진행은 (키, 코드 종류, 박 수) 목록이고, 각 코드는 직전 코드에서 가장 적게 움직이는
+# 전위 / 옥타브로 보이싱한 뒤 전체를 크로스페이드 overlap-add 한 번으로 합성한다
+#   render_progression(ii_v_i('C'), bpm=120)
+import numpy as np
+
+from chordplay.synth import SAMPLE_RATE, SYNTH_DTYPE, iter_chord_rows, notes_to_freqs, quantize
+from chordplay.theory import NOTE_INDEX, NOTE_NAMES, generate_correct_answer
+from chordplay.voicing import iter_voicings
+
+CROSSFADE = 0.02  # 코드 사이 크로스페이드 길이 (초)
+VOICING_RANGE = (48, 84)  # 보이싱의 모든 음이 들어가야 하는 MIDI 범위 (C3 ~ C6, 음역이 위아래로 흘러가지 않도록)
+
+def transpose_key(key, semitones):
+    return NOTE_NAMES[(NOTE_INDEX[key] + semitones) % 12]
+
+# 장조 ii–V–I (minor=True면 단조 iiø–V7–i). I은 두 배 길이로 끝맺음
+def ii_v_i(key, beats=4, minor=False):
+    if minor:
+        return [(transpose_key(key, 2), 'Half Diminished7', beats), (transpose_key(key, 7), 'Dominant7', beats),
+                (key, 'minor7', beats * 2)]
+    return [(transpose_key(key, 2), 'minor7', beats), (transpose_key(key, 7), 'Dominant7', beats),
+            (key, 'Major7', beats * 2)]
+
+# 두 보이싱 사이의 움직임: 각 음에서 상대 코드의 가장 가까운 음까지의 거리(반음)를 양방향으로 합산
+def voice_movement(previous, voicing):
+    previous = [note.midi for note in previous]
+    voicing = [note.midi for note in voicing]
+    return (sum(min(abs(a - b) for b in previous) for a in voicing)
+            + sum(min(abs(a - b) for a in voicing) for b in previous))
+
+# iter_voicings가 내보내는 보이싱(전위, 옥타브 이동, styles에 따라 drop2 등) 중 직전 보이싱에서 가장 적게 움직이는 것을 고름
+def voice_lead(previous, chord_notes, voicing_range=VOICING_RANGE, styles=('close',)):
+    low, high = voicing_range
+    return min(iter_voicings(chord_notes, styles=styles, low=low, high=high),
+               key=lambda voicing: voice_movement(previous, voicing))
+
+# 첫 코드는 기본형, 이후 코드는 voice_lead로 이어서 보이싱
+def voice_progression(steps, voicing_range=VOICING_RANGE, styles=('close',)):
+    voicings = []
+    for key, chord_type, _ in steps:
+        chord_notes = generate_correct_answer(key, chord_type)
+        voicings.append(voice_lead(voicings[-1], chord_notes, voicing_range, styles) if voicings else chord_notes)
+    return voicings
+
+def render_progression(steps, bpm=120, sample_rate=SAMPLE_RATE, crossfade=CROSSFADE, dtype=SYNTH_DTYPE,
+                       batch_size=16, styles=('close',)):
+    if not steps:
+        raise ValueError("render_progression needs at least one chord")
+    if any(beats <= 0 for _, _, beats in steps):
+        raise ValueError("every chord in a progression must last a positive number of beats")
+    dtype = np.dtype(dtype)
+    voicings = voice_progression(steps, styles=styles)
+    beat_length = sample_rate * 60 / bpm
+    # 크로스페이드는 가장 짧은 코드보다 길 수 없음 (이웃한 코드끼리만 겹치도록)
+    fade = min(int(sample_rate * crossfade), int(min(beats for _, _, beats in steps) * beat_length))
+    # 각 코드는 다음 코드 시작 후 fade 샘플까지 이어지며, 겹치는 구간에서 선형 페이드 아웃 / 인이 합쳐 1이 됨
+    boundaries = np.rint(np.cumsum([0] + [beats for _, _, beats in steps]) * beat_length).astype(np.intp)
+    starts = boundaries[:-1]
+    lengths = np.diff(boundaries) + fade
+    total_length = int(boundaries[-1]) + fade
+
+    # 길이가 같은 코드끼리 묶어 (코드 × 샘플) 2차원 배열로 한꺼번에 합성
+    groups = {}
+    for i, length in enumerate(lengths):
+        groups.setdefault(int(length), []).append(i)
+
+    # overlap-add: 코드마다 시작 위치의 슬라이스에 더한다 (인덱스 배열 없이 제자리 덧셈)
+    progression = np.zeros(total_length, dtype=dtype)
+    for length, members in groups.items():
+        t = np.arange(length, dtype=dtype) / dtype.type(sample_rate)
+        envelope = np.ones(length, dtype=dtype)
+        if fade:
+            ramp = np.arange(fade, dtype=dtype) / dtype.type(fade)
+            envelope[:fade] = ramp
+            envelope[-fade:] = 1 - ramp
+        # 진행에는 같은 음이 반복되므로 고유 주파수별 사인파 테이블로 묶어서 합성 (iter_chord_rows)
+        chords = [notes_to_freqs(voicings[i]) for i in members]
+        for start, rows in iter_chord_rows(chords, t, batch_size):
+            rows *= envelope
+            for i, chord in zip(members[start:start + len(rows)], rows):
+                progression[starts[i]:starts[i] + length] += chord
+
+    return quantize(progression)
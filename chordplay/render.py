@@ -0,0 +1,96 @@
+import functools
+import os
+
+from chordplay.encoder import CODECS, encode_audio
+from chordplay.metrics import METRICS, profile_render, timer
+from chordplay.oscillator import HARMONICS, WavetableOscillator
+from chordplay.samples import SampleBank
+from chordplay.synth import A4_FREQ, SAMPLE_RATE, SYNTH_DTYPE, create_arpeggio_audio, create_chord_audio, notes_to_freqs
+from chordplay.theory import generate_correct_answer, iter_inversion_arpeggio
+
+# CHORDPLAY_WAVEFORM (sine / saw / square / piano)을 설정하면 웨이브테이블 오실레이터로 합성, 없으면 np.sin 사용
+WAVEFORM = os.environ.get('CHORDPLAY_WAVEFORM')
+if WAVEFORM and WAVEFORM not in HARMONICS:
+    raise ValueError(f"CHORDPLAY_WAVEFORM must be one of {tuple(HARMONICS)}, got {WAVEFORM!r}")
+
+# CHORDPLAY_SAMPLE_BANK=폴더 를 설정하면 해당 폴더의 음별 WAV(C4.wav 등)로 재생 (CHORDPLAY_WAVEFORM보다 우선)
+SAMPLE_BANK = os.environ.get('CHORDPLAY_SAMPLE_BANK')
+
+# 샘플 뱅크는 프로세스당 한 번만 연다 (메모리 매핑이라 여는 비용은 작지만 파일 목록 확인을 반복하지 않도록)
+@functools.lru_cache(maxsize=None)
+def get_sample_bank(directory):
+    return SampleBank(directory)
+
+def get_oscillator():
+    if SAMPLE_BANK:
+        return get_sample_bank(SAMPLE_BANK)
+    if WAVEFORM:
+        return WavetableOscillator(WAVEFORM)
+    return None
+
+# 클립 키에 들어가지 않지만 소리를 바꾸는 합성 설정. 사전 렌더링 팩에 기록해 두고, 앱은 설정이 다른 팩을 쓰지 않는다
+def synthesis_settings():
+    return {
+        'waveform': WAVEFORM,
+        'sample_bank': os.path.abspath(SAMPLE_BANK) if SAMPLE_BANK else None,
+        'a4': A4_FREQ,
+        'dtype': SYNTH_DTYPE.name,
+    }
+
+# 브라우저로 보낼 오디오 코덱과 비트레이트 (CHORDPLAY_AUDIO_CODEC: mp3 / opus / aac / wav)
+AUDIO_CODEC = os.environ.get('CHORDPLAY_AUDIO_CODEC', 'mp3')
+AUDIO_BITRATE = os.environ.get('CHORDPLAY_AUDIO_BITRATE', '64k')
+if AUDIO_CODEC != 'wav' and AUDIO_CODEC not in CODECS:
+    raise ValueError(f"CHORDPLAY_AUDIO_CODEC must be one of {('wav', *CODECS)}, got {AUDIO_CODEC!r}")
+
+# 정답 오디오의 캐시 키. 블록 코드는 BPM / subdivision과 무관하고 아르페지오는 chord_duration과 무관하므로
+# 해당 값을 None으로 두어 같은 캐시 항목을 공유
+def answer_cache_key(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision):
+    if mode == 'chord':
+        return (key, chord_type, mode, None, sample_rate, chord_duration, None)
+    return (key, chord_type, mode, bpm, sample_rate, None, subdivision)
+
+# 캐시를 거치지 않는 정답 오디오 합성. 단계별 시간은 chordplay.metrics에 기록 (synthesis에는 int16 변환까지 포함됨)
+def synthesize_answer_audio(key, chord_type, mode, bpm, sample_rate=SAMPLE_RATE, chord_duration=2, subdivision=2):
+    with timer('chord_construction'):
+        chord_notes = generate_correct_answer(key, chord_type)
+        if mode == 'arpeggio':
+            chord_notes = iter_inversion_arpeggio(chord_notes)
+    with timer('frequency_lookup'):
+        frequencies = notes_to_freqs(chord_notes)
+    oscillator = get_oscillator()
+    with timer('synthesis'):
+        if mode == 'arpeggio':
+            audio_data = create_arpeggio_audio(frequencies, bpm, sample_rate, oscillator=oscillator,
+                                               dtype=SYNTH_DTYPE, subdivision=subdivision)
+        else:
+            audio_data = create_chord_audio(frequencies, duration=chord_duration, sample_rate=sample_rate,
+                                            oscillator=oscillator, dtype=SYNTH_DTYPE)
+    METRICS.inc('rendered_bytes_total', audio_data.nbytes)
+    return audio_data
+
+def render_answer_audio(key, chord_type, mode, bpm, cache, sample_rate=SAMPLE_RATE, chord_duration=2, subdivision=2):
+    cache_key = answer_cache_key(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision)
+    return cache.get_or_render(cache_key, lambda: synthesize_answer_audio(key, chord_type, mode, bpm, sample_rate,
+                                                                          chord_duration, subdivision))
+
+# 인코딩된 정답 클립의 키 (캐시와 사전 렌더링 팩에서 같이 사용)
+def answer_clip_key(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision, codec, bitrate):
+    return answer_cache_key(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision) + (codec, bitrate)
+
+# 캐시를 거치지 않는 합성 + 인코딩 (사전 렌더링처럼 클립마다 한 번만 만드는 경우에 바로 사용)
+def synthesize_answer_clip(key, chord_type, mode, bpm, sample_rate=SAMPLE_RATE, chord_duration=2, subdivision=2,
+                           codec=AUDIO_CODEC, bitrate=AUDIO_BITRATE):
+    with profile_render():
+        audio_data = synthesize_answer_audio(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision)
+        with timer('encode'):
+            audio_bytes, mime = encode_audio(audio_data, sample_rate, codec, bitrate)
+    METRICS.inc('encoded_bytes_total', len(audio_bytes))
+    return audio_bytes, mime
+
+# 캐시에는 인코딩된 클립만 저장 (중간 PCM까지 넣으면 같은 정답이 두 번, 그중 무압축본이 예산 대부분을 차지)
+def render_answer_clip(key, chord_type, mode, bpm, cache, sample_rate=SAMPLE_RATE, chord_duration=2, subdivision=2,
+                       codec=AUDIO_CODEC, bitrate=AUDIO_BITRATE):
+    cache_key = answer_clip_key(key, chord_type, mode, bpm, sample_rate, chord_duration, subdivision, codec, bitrate)
+    return cache.get_or_render(cache_key, lambda: synthesize_answer_clip(key, chord_type, mode, bpm, sample_rate,
+                                                                         chord_duration, subdivision, codec, bitrate))
@@ -0,0 +1,84 @@
+# 샘플 기반 악기. 음마다(또는 몇 반음마다) 녹음한 WAV 폴더를 악기 하나로 쓴다.
+# 파일 이름이 음 이름이나 MIDI 번호인 WAV (C4.wav, A#3.wav, 60.wav)를 int16 그대로 메모리 매핑하므로
+# 불러오는 비용이 거의 없고, 같은 폴더를 여는 여러 프로세스가 OS 페이지 캐시를 공유한다.
+# 오실레이터와 같은 방식으로 호출되므로 create_chord_audio / create_arpeggio_audio에 그대로 넘기면 된다
+#   bank = SampleBank('samples/piano')
+#   create_chord_audio(freqs, 2, oscillator=bank)
+import bisect
+import math
+import os
+
+import numpy as np
+
+from chordplay.analysis import open_wav_memmap
+from chordplay.encoder import audio_to_wav_bytes
+from chordplay.synth import A4_FREQ, note_to_freq
+from chordplay.theory import Note
+
+RELEASE_SECONDS = 0.005  # 음을 중간에 자를 때 클릭이 나지 않도록 끝을 줄이는 길이
+
+# 'C4' / 'A#3' / '60' 형태의 파일 이름을 MIDI 번호로. 음 이름이 아니면 None
+def sample_note(filename):
+    stem, extension = os.path.splitext(filename)
+    if extension.lower() != '.wav':
+        return None
+    if stem.lstrip('-').isdigit():
+        return int(stem)
+    try:
+        return Note.from_name(stem).midi
+    except (KeyError, ValueError):
+        return None
+
+class SampleBank:
+    def __init__(self, directory, a4=A4_FREQ):
+        self.directory = directory
+        self.a4 = a4
+        self.samples = {}  # MIDI 번호 -> (int16 메모리 매핑 배열, 샘플레이트)
+        for filename in sorted(os.listdir(directory)):
+            midi = sample_note(filename)
+            if midi is None:
+                continue
+            data, sample_rate = open_wav_memmap(os.path.join(directory, filename))
+            if data.dtype != np.int16:
+                raise ValueError(f"{filename}: sample bank files must be 16-bit PCM")
+            self.samples[midi] = (data[:, 0], sample_rate)  # 첫 채널 뷰 (복사 없음)
+        if not self.samples:
+            raise ValueError(f"no note samples (e.g. C4.wav) found in {directory}")
+        self.notes = sorted(self.samples)
+
+    # 음높이(소수 MIDI 번호 가능)에 가장 가까운 샘플의 MIDI 번호
+    def nearest(self, midi):
+        i = bisect.bisect_left(self.notes, midi)
+        candidates = self.notes[max(0, i - 1):i + 1]
+        return min(candidates, key=lambda note: abs(note - midi))
+
+    # 가장 가까운 샘플을 재생 속도 비율만큼 np.interp로 다시 읽어 음높이를 맞춘다 (빈 음은 이렇게 채워짐).
+    # 필요한 구간만 읽으며, 샘플이 duration보다 짧으면 나머지는 무음
+    def __call__(self, freq, duration, sample_rate=44100, dtype=np.float64):
+        length = int(sample_rate * duration)
+        sample_midi = self.nearest(69 + 12 * math.log2(freq / self.a4))
+        data, source_rate = self.samples[sample_midi]
+        step = freq / note_to_freq(sample_midi, self.a4) * source_rate / sample_rate
+        if abs(step - 1) < 1e-9:
+            # 샘플과 음높이 / 샘플레이트가 같으면 다시 읽을 필요 없이 그대로 변환
+            note = np.zeros(length, dtype=dtype)
+            available = min(length, len(data))
+            note[:available] = data[:available]
+        else:
+            positions = np.arange(length) * step
+            end = min(len(data), int(positions[-1]) + 2) if length else 0
+            note = np.interp(positions, np.arange(end), data[:end], right=0).astype(dtype, copy=False)
+        release = min(length, int(sample_rate * RELEASE_SECONDS))
+        if release:
+            note[-release:] *= np.linspace(1, 0, release, dtype=note.dtype)
+        return note
+
+# 오실레이터로 샘플 뱅크 폴더를 만든다 (notes의 각 음을 <음 이름>.wav로, 지수 감쇠 적용). 실제 녹음이 없을 때 시험용
+def write_sample_bank(directory, oscillator, notes=range(36, 97, 3), duration=2, sample_rate=44100, decay=3.0):
+    os.makedirs(directory, exist_ok=True)
+    envelope = np.exp(-decay * np.arange(int(sample_rate * duration)) / sample_rate)
+    for midi in notes:
+        note = oscillator(note_to_freq(midi), duration, sample_rate) * envelope
+        note *= 32767 / np.max(np.abs(note))
+        with open(os.path.join(directory, f'{Note(midi)}.wav'), 'wb') as wav_file:
+            wav_file.write(audio_to_wav_bytes(note.astype(np.int16), sample_rate))
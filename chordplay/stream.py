@@ -0,0 +1,132 @@
+# 긴 연습 트랙을 고정 크기 int16 청크로 나눠 생성하는 스트리밍 렌더러.
+# 한 번에 한 구간(코드 하나 또는 아르페지오 하나)만 합성하므로 트랙 길이와 상관없이 메모리 사용량이 일정하다
+#   python -m chordplay.stream drill.wav --bpm 120      # 120개 코드 전체 드릴 트랙을 파일로
+#   python -m chordplay.stream - --bpm 90 > drill.wav   # 표준 출력으로 (HTTP 응답 본문 등에 그대로 연결)
+import argparse
+import struct
+import sys
+
+import numpy as np
+
+from chordplay.synth import SAMPLE_RATE, SYNTH_DTYPE, create_arpeggio_audio, create_chord_audio, notes_to_freqs
+from chordplay.theory import chord_types, generate_correct_answer, iter_inversion_arpeggio, keys
+
+CHUNK_SIZE = 4096  # 청크당 샘플 수
+
+# 구간은 ('chord', 주파수들, 길이(초)) 또는 ('arpeggio', 주파수들, bpm, subdivision)
+def chord_segment(frequencies, duration):
+    return ('chord', frequencies, duration)
+
+def arpeggio_segment(frequencies, bpm, subdivision=2):
+    return ('arpeggio', frequencies, bpm, subdivision)
+
+# 합성하지 않고 구간의 샘플 수만 계산 (create_chord_audio / create_arpeggio_audio와 같은 식)
+def segment_length(segment, sample_rate=SAMPLE_RATE):
+    if segment[0] == 'chord':
+        _, _, duration = segment
+        return int(sample_rate * duration)
+    _, frequencies, bpm, subdivision = segment
+    return len(frequencies) * int(sample_rate * (60 / bpm / subdivision))
+
+def render_segment(segment, sample_rate=SAMPLE_RATE, oscillator=None, dtype=SYNTH_DTYPE):
+    if segment[0] == 'chord':
+        _, frequencies, duration = segment
+        return create_chord_audio(frequencies, duration, sample_rate, oscillator=oscillator, dtype=dtype)
+    _, frequencies, bpm, subdivision = segment
+    return create_arpeggio_audio(frequencies, bpm, sample_rate, oscillator=oscillator, dtype=dtype,
+                                 subdivision=subdivision)
+
+# 드릴 트랙: 모든 키 × 모든 코드 종류에 대해 블록 코드 다음 전위 아르페지오
+def drill_segments(bpm, chord_duration=2, subdivision=2, items=None):
+    if items is None:
+        items = [(key, chord_type) for key in keys for chord_type in chord_types]
+    for key, chord_type in items:
+        chord_notes = generate_correct_answer(key, chord_type)
+        yield chord_segment(notes_to_freqs(chord_notes), chord_duration)
+        yield arpeggio_segment(notes_to_freqs(iter_inversion_arpeggio(chord_notes)), bpm, subdivision)
+
+# drill_segments 트랙 전체의 샘플 수. 주파수 배열을 만들지 않고 음 개수만 세므로 스트리밍 전에 WAV 헤더 크기를 정할 수 있다
+def drill_length(bpm, chord_duration=2, subdivision=2, items=None, sample_rate=SAMPLE_RATE):
+    if items is None:
+        items = [(key, chord_type) for key in keys for chord_type in chord_types]
+    chord_length = int(sample_rate * chord_duration)
+    note_length = int(sample_rate * (60 / bpm / subdivision))
+    return sum(chord_length + note_length * sum(1 for _ in iter_inversion_arpeggio(generate_correct_answer(*item)))
+               for item in items)
+
+# 구간들을 이어 붙여 chunk_size 샘플짜리 int16 배열을 차례로 내보낸다 (마지막 청크만 짧을 수 있음)
+def stream_audio(segments, sample_rate=SAMPLE_RATE, chunk_size=CHUNK_SIZE, oscillator=None, dtype=SYNTH_DTYPE):
+    chunk = np.empty(chunk_size, dtype=np.int16)
+    filled = 0
+    for segment in segments:
+        audio = render_segment(segment, sample_rate, oscillator, dtype)
+        position = 0
+        while position < len(audio):
+            count = min(chunk_size - filled, len(audio) - position)
+            chunk[filled:filled + count] = audio[position:position + count]
+            filled += count
+            position += count
+            if filled == chunk_size:
+                # 소비자가 청크를 들고 있어도 다음 청크에 덮어쓰이지 않도록 복사본을 내보냄
+                yield chunk.copy()
+                filled = 0
+    if filled:
+        yield chunk[:filled].copy()
+
+# 44바이트 PCM WAV 헤더 (16비트 모노). 전체 길이를 미리 알기 때문에 뒤에서 고쳐 쓸 필요가 없다
+# 길이를 모르면(num_samples=None) 크기 필드를 0xFFFFFFFF로 둔다 (스트리밍 WAV에서 흔히 쓰는 '끝까지 읽기' 값)
+def wav_header(num_samples, sample_rate=SAMPLE_RATE):
+    data_size = 0xFFFFFFFF - 36 if num_samples is None else num_samples * 2
+    return struct.pack('<4sI4s4sIHHIIHH4sI', b'RIFF', 36 + data_size, b'WAVE', b'fmt ', 16, 1, 1,
+                       sample_rate, sample_rate * 2, 2, 16, b'data', data_size)
+
+# WAV 파일 내용을 바이트 청크로 내보낸다. 파일, 소켓, HTTP 스트리밍 응답 어디에든 순서대로 쓰면 된다.
+# 헤더의 길이는 num_samples(drill_length 등)로 받는다. 구간을 목록으로 주면 그 자리에서 계산하고,
+# 제너레이터를 그대로 주면 구간을 모아 두지 않도록 길이 미상 헤더를 쓴다
+def stream_wav(segments, sample_rate=SAMPLE_RATE, chunk_size=CHUNK_SIZE, oscillator=None, dtype=SYNTH_DTYPE,
+               num_samples=None):
+    if num_samples is None and isinstance(segments, (list, tuple)):
+        num_samples = sum(segment_length(segment, sample_rate) for segment in segments)
+    yield wav_header(num_samples, sample_rate)
+    written = 0
+    for chunk in stream_audio(segments, sample_rate, chunk_size, oscillator, dtype):
+        written += len(chunk)
+        yield chunk.astype('<i2', copy=False).tobytes()
+    if num_samples is not None and written != num_samples:
+        raise ValueError(f"WAV header promised {num_samples} samples but the segments produced {written}")
+
+# 탐색 가능한 파일이면 다 쓴 뒤 실제 길이로 헤더를 다시 쓴다 (길이를 미리 몰라도 올바른 WAV가 됨)
+def write_wav(file, segments, sample_rate=SAMPLE_RATE, chunk_size=CHUNK_SIZE, oscillator=None, dtype=SYNTH_DTYPE,
+              num_samples=None):
+    start = file.tell() if file.seekable() else None
+    written = 0
+    for data in stream_wav(segments, sample_rate, chunk_size, oscillator, dtype, num_samples):
+        file.write(data)
+        written += len(data)
+    if start is not None and num_samples is None:
+        end = file.tell()
+        file.seek(start)
+        file.write(wav_header((written - len(wav_header(0))) // 2, sample_rate))
+        file.seek(end)
+    return written
+
+def main():
+    parser = argparse.ArgumentParser(description='Render a ChordPlay drill track as a streamed WAV file')
+    parser.add_argument('output', help="output path, or '-' for stdout")
+    parser.add_argument('--bpm', type=int, default=120)
+    parser.add_argument('--chord-duration', type=float, default=2)
+    parser.add_argument('--subdivision', type=int, default=2)
+    parser.add_argument('--sample-rate', type=int, default=SAMPLE_RATE)
+    args = parser.parse_args()
+
+    segments = drill_segments(args.bpm, args.chord_duration, args.subdivision)
+    num_samples = drill_length(args.bpm, args.chord_duration, args.subdivision, sample_rate=args.sample_rate)
+    if args.output == '-':
+        write_wav(sys.stdout.buffer, segments, args.sample_rate, num_samples=num_samples)
+        return
+    with open(args.output, 'wb') as output:
+        written = write_wav(output, segments, args.sample_rate, num_samples=num_samples)
+    print(f"wrote {written} bytes to {args.output}", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
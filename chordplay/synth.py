@@ -0,0 +1,134 @@
+import base64
+import functools
+import os
+import random
+
+import numpy as np
+
+from chordplay.encoder import audio_to_wav_bytes
+from chordplay.theory import as_note, chord_types, generate_correct_answer, keys
+
+# A4 기준 주파수는 CHORDPLAY_A4 환경 변수로 설정 (기본 440Hz)
+A4_FREQ = float(os.environ.get('CHORDPLAY_A4', 440))
+
+# MIDI 0~127 전체의 주파수를 미리 계산한 테이블
+@functools.lru_cache(maxsize=8)
+def get_freq_table(a4=A4_FREQ):
+    table = a4 * 2 ** ((np.arange(128) - 69) / 12)
+    table.setflags(write=False)
+    return table
+
+FREQ_TABLE = get_freq_table()
+
+# 테이블 범위(MIDI 0~127)를 벗어난 음은 음수 인덱스가 뒤에서부터 읽히지 않도록 ValueError
+def check_midi_range(low, high):
+    if low < 0 or high > 127:
+        raise ValueError(f"MIDI note numbers must be within 0-127, got {low if low < 0 else high}")
+
+def note_to_freq(note, a4=A4_FREQ):
+    midi = as_note(note).midi
+    check_midi_range(midi, midi)
+    return float(get_freq_table(a4)[midi])
+
+def notes_to_freqs(notes, a4=A4_FREQ):
+    # MIDI 번호 배열은 그대로 인덱싱하고, 그 외에는 MIDI 번호만 뽑아 한 번에 조회 (제너레이터도 목록으로 만들지 않고 바로 읽음)
+    if isinstance(notes, np.ndarray):
+        midi = notes
+    else:
+        count = len(notes) if hasattr(notes, '__len__') else -1
+        midi = np.fromiter((as_note(note).midi for note in notes), dtype=np.intp, count=count)
+    if midi.size:
+        check_midi_range(midi.min(), midi.max())
+    return get_freq_table(a4)[midi]
+
+# 합성 샘플레이트와 float 정밀도는 CHORDPLAY_SAMPLE_RATE / CHORDPLAY_DTYPE 환경 변수로 설정
+SAMPLE_RATES = (22050, 32000, 44100)
+SAMPLE_RATE = int(os.environ.get('CHORDPLAY_SAMPLE_RATE', 44100))
+SYNTH_DTYPE = np.dtype(os.environ.get('CHORDPLAY_DTYPE', 'float32'))
+if SAMPLE_RATE not in SAMPLE_RATES:
+    raise ValueError(f"CHORDPLAY_SAMPLE_RATE must be one of {SAMPLE_RATES}, got {SAMPLE_RATE}")
+
+# float 오디오를 마지막 축(음 / 코드 하나)마다 최댓값으로 정규화해 int16으로 변환. 입력 배열을 제자리에서 바꾼다.
+# 합성 단계의 시간은 호출하는 쪽(render.synthesize_answer_audio의 synthesis 단계)에서 한 번에 잰다
+def quantize(audio):
+    audio /= np.max(np.abs(audio), axis=-1, keepdims=True)  # Normalize
+    audio *= 32767
+    return audio.astype(np.int16)
+
+def create_sine_wave(freq, duration, sample_rate=44100, dtype=np.float64):
+    dtype = np.dtype(dtype)
+    t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=dtype)
+    # 주파수 스칼라를 같은 dtype으로 맞춰야 float32 배열이 float64로 승격되지 않음
+    return np.sin(dtype.type(2 * np.pi * freq) * t)
+
+# oscillator를 주면 np.sin 대신 해당 오실레이터(예: WavetableOscillator)로 각 음을 만든다 (None이면 create_sine_wave)
+def create_chord_audio(frequencies, duration=1, sample_rate=44100, oscillator=None, dtype=np.float64):
+    if oscillator is None:
+        oscillator = create_sine_wave
+    chord = np.zeros(int(sample_rate * duration), dtype=dtype)
+    # 위상이 이어지는 오실레이터(WavetableOscillator)는 동시에 울리는 성부마다 위상 0에서 시작해야
+    # 코드 첫 샘플이 0이 되고 (클릭 없음) 같은 코드를 몇 번 만들어도 결과가 같다
+    reset = getattr(oscillator, 'reset', None)
+    for freq in frequencies:
+        if reset is not None:
+            reset()
+        chord += oscillator(freq, duration, sample_rate, dtype=dtype)
+    return quantize(chord)
+
+# subdivision은 한 박을 나누는 수 (2 = 8분음표, 4 = 16분음표)
+def create_arpeggio_audio(frequencies, bpm, sample_rate=44100, oscillator=None, dtype=np.float64, subdivision=2):
+    dtype = np.dtype(dtype)
+    note_duration = 60 / bpm / subdivision
+    note_length = int(sample_rate * note_duration)
+    # 전체 길이를 미리 계산해 버퍼를 한 번만 할당하고 음마다 제자리에 기록
+    arpeggio = np.empty(note_length * len(frequencies), dtype=np.int16)
+    t = np.linspace(0, note_duration, note_length, False, dtype=dtype)
+    for i, freq in enumerate(frequencies):
+        if oscillator is None:
+            note = np.sin(dtype.type(2 * np.pi * freq) * t)
+        else:
+            note = oscillator(freq, note_duration, sample_rate, dtype=dtype)
+        arpeggio[i * note_length:(i + 1) * note_length] = quantize(note)
+    return arpeggio
+
+# 여러 코드를 공유 시간축 t 하나로 합성해 batch_size 개씩 (시작 번호, (코드 × 샘플) float 배열)로 내보낸다.
+# 각 행은 코드마다 최댓값 1로 정규화되어 있다. create_chord_batch_audio와 progression.render_progression이 함께 사용
+def iter_chord_rows(chords, t, batch_size=32):
+    voices = max((len(frequencies) for frequencies in chords), default=0)
+    # 성부 수가 다른 코드는 0Hz로 채움 (sin(0) = 0 이므로 결과에 영향 없음)
+    freqs = np.zeros((len(chords), voices))
+    for i, frequencies in enumerate(chords):
+        freqs[i, :len(frequencies)] = frequencies
+
+    # 같은 음은 한 번만 계산: 고유 주파수별 사인파 (고유 주파수 × 샘플)를 만든 뒤 인덱싱으로 합산
+    unique_freqs, voice_index = np.unique(freqs, return_inverse=True)
+    voice_index = voice_index.reshape(freqs.shape)
+    sines = np.sin((2 * np.pi * unique_freqs[:, None]).astype(t.dtype) * t)
+
+    # float 작업 메모리를 제한하기 위해 batch_size 개씩 나눠서 합성
+    for start in range(0, len(chords), batch_size):
+        block = voice_index[start:start + batch_size]
+        rows = np.zeros((len(block), len(t)), dtype=t.dtype)
+        for voice in range(voices):
+            rows += sines[block[:, voice]]
+        rows /= np.max(np.abs(rows), axis=1, keepdims=True)  # Normalize
+        yield start, rows
+
+# 여러 코드를 한 번에 합성해 (코드 × 샘플) int16 배열로 반환
+def create_chord_batch_audio(chords, duration=1, sample_rate=44100, batch_size=32, dtype=np.float64):
+    t = np.linspace(0, duration, int(sample_rate * duration), False, dtype=dtype)
+    audio = np.empty((len(chords), len(t)), dtype=np.int16)
+    for start, rows in iter_chord_rows(chords, t, batch_size):
+        rows *= 32767  # 행마다 이미 정규화됨
+        audio[start:start + len(rows)] = rows
+    return audio
+
+# 귀 훈련용 문제 세트를 미리 생성 (같은 seed면 같은 문제)
+def generate_quiz_set(count, duration=2, sample_rate=44100, seed=None, dtype=np.float64):
+    rng = random.Random(seed)
+    items = [(rng.choice(keys), rng.choice(chord_types)) for _ in range(count)]
+    chords = [notes_to_freqs(generate_correct_answer(key, chord_type)) for key, chord_type in items]
+    return items, create_chord_batch_audio(chords, duration, sample_rate, dtype=dtype)
+
+def get_audio_base64(audio_data, sample_rate=44100):
+    return base64.b64encode(audio_to_wav_bytes(audio_data, sample_rate)).decode()
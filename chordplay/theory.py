@@ -0,0 +1,153 @@
+import numbers
+
+keys = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+chord_types = ['Major', 'minor', 'sus4', 'aug', 'dim', 'Major7', 'minor7', 'Dominant7', 'Diminished7', 'Half Diminished7']
+
+NOTE_NAMES = keys
+NOTE_INDEX = {name: i for i, name in enumerate(NOTE_NAMES)}
+CHORD_INTERVALS = {
+    'Major': (0, 4, 7),
+    'minor': (0, 3, 7),
+    'sus4': (0, 5, 7),
+    'aug': (0, 4, 8),
+    'dim': (0, 3, 6),
+    'Major7': (0, 4, 7, 11),
+    'minor7': (0, 3, 7, 10),
+    'Dominant7': (0, 4, 7, 10),
+    'Diminished7': (0, 3, 6, 9),
+    'Half Diminished7': (0, 3, 6, 10),
+    # 확장 / 변형 코드 (코드 이름 맞히기와 분석용. 퀴즈 출제 목록 chord_types에는 들어가지 않음)
+    'Major6': (0, 4, 7, 9),
+    'minor6': (0, 3, 7, 9),
+    'add9': (0, 4, 7, 14),
+    'Major9': (0, 4, 7, 11, 14),
+    'minor9': (0, 3, 7, 10, 14),
+    'Dominant9': (0, 4, 7, 10, 14),
+    'Dominant11': (0, 4, 7, 10, 14, 17),
+    'Dominant13': (0, 4, 7, 10, 14, 21),
+    'Dominant7b9': (0, 4, 7, 10, 13),
+    'Dominant7#9': (0, 4, 7, 10, 15),
+    'Dominant7b5': (0, 4, 6, 10),
+    'Dominant7#5': (0, 4, 8, 10),
+}
+extended_chord_types = [chord_type for chord_type in CHORD_INTERVALS if chord_type not in chord_types]
+
+# 음 집합을 12비트 피치 클래스 마스크로 표현 (비트 i = 피치 클래스 i, C = 0)
+def pitch_class_mask(notes):
+    mask = 0
+    for note in notes:
+        mask |= 1 << as_note(note).midi % 12
+    return mask
+
+# 역인덱스: 마스크 4096개 각각 -> 그 음 집합이 되는 (근음, 코드 종류) 목록.
+# Diminished7 / aug처럼 대칭인 코드나 Major6 = minor7 전위처럼 같은 음 집합을 갖는 이름이 모두 들어간다
+def build_chord_index():
+    index = [()] * 4096
+    for chord_type, intervals in CHORD_INTERVALS.items():
+        for root in range(12):
+            mask = 0
+            for interval in intervals:
+                mask |= 1 << (root + interval) % 12
+            index[mask] += ((NOTE_NAMES[root], chord_type),)
+    return tuple(index)
+
+CHORD_INDEX = build_chord_index()
+
+# 코드 종류별 구성음의 피치 클래스 순서 (전위 번호 = 베이스가 몇 번째 구성음인지)
+CHORD_TONE_ORDER = {chord_type: {interval % 12: i for i, interval in enumerate(intervals)}
+                    for chord_type, intervals in CHORD_INTERVALS.items()}
+
+# MIDI 번호로 표현한 음 (C4 = 60). 문자열은 화면에 표시할 때만 만든다
+class Note:
+    __slots__ = ('midi',)
+
+    def __init__(self, midi):
+        self.midi = midi
+
+    @classmethod
+    def from_name(cls, name):
+        # 'C#4', 'A-1', 'C10' 처럼 두 자리/음수 옥타브도 처리
+        split = 2 if name[1:2] == '#' else 1
+        return cls(NOTE_INDEX[name[:split]] + (int(name[split:]) + 1) * 12)
+
+    @property
+    def pitch_class(self):
+        return self.midi % 12
+
+    @property
+    def octave(self):
+        return self.midi // 12 - 1
+
+    @property
+    def name(self):
+        return NOTE_NAMES[self.midi % 12]
+
+    def transpose(self, semitones):
+        return Note(self.midi + semitones)
+
+    def __eq__(self, other):
+        return getattr(other, 'midi', None) == self.midi
+
+    def __hash__(self):
+        return hash(self.midi)
+
+    def __str__(self):
+        return f"{self.name}{self.octave}"
+
+    def __repr__(self):
+        return f"Note({self}, midi={self.midi})"
+
+# 문자열 / MIDI 번호 / Note 어느 것이 와도 Note로 변환
+def as_note(note):
+    if isinstance(note, str):
+        return Note.from_name(note)
+    if isinstance(note, numbers.Integral):
+        return Note(int(note))
+    return note
+
+def generate_correct_answer(key, chord_type):
+    root = 60 + NOTE_INDEX[key]  # 기본 옥타브를 4로 설정
+    return [Note(root + interval) for interval in CHORD_INTERVALS[chord_type]]
+
+# 기본형, 1전위, 2전위 ... 순서로 전위를 하나씩 만들어 내보낸다 (아래 음부터 한 옥타브씩 올림)
+def iter_inversions(chord_notes):
+    raised = [raise_octave(note) for note in chord_notes]
+    for i in range(len(chord_notes)):
+        yield chord_notes[i:] + raised[:i]
+
+def chord_inversions(chord_notes):
+    return list(iter_inversions(chord_notes))
+
+# 전위 아르페지오 음을 차례로 내보낸다: 모든 전위를 올라간 뒤 같은 음들을 거꾸로 내려옴.
+# 한 옥타브 올린 음 목록 하나만 만들고, 전위 목록을 이어 붙이거나 뒤집은 사본은 만들지 않는다
+def iter_inversion_arpeggio(chord_notes):
+    raised = [raise_octave(note) for note in chord_notes]
+    for i in range(len(chord_notes)):
+        yield from chord_notes[i:]
+        yield from raised[:i]
+    for i in reversed(range(len(chord_notes))):
+        yield from reversed(raised[:i])
+        yield from reversed(chord_notes[i:])
+
+def generate_inversions(chord_notes):
+    return list(iter_inversion_arpeggio(chord_notes))
+
+def raise_octave(note):
+    return as_note(note).transpose(12)
+
+# 음 목록의 가능한 코드 이름을 (근음, 코드 종류, 전위) 목록으로 반환. 가장 낮은 음이 베이스이고
+# 전위는 0 = 기본형, 1 = 1전위 ... 음 개수와 상관없이 마스크 조회 한 번으로 찾는다
+def identify_chord(notes):
+    notes = [as_note(note) for note in notes]
+    if not notes:
+        return []
+    bass = min(note.midi for note in notes)
+    return [(root, chord_type, CHORD_TONE_ORDER[chord_type][(bass - NOTE_INDEX[root]) % 12])
+            for root, chord_type in CHORD_INDEX[pitch_class_mask(notes)]]
+
+# 'C Major7', 전위면 슬래시 코드로 'C Major7/E'
+def chord_name(root, chord_type, inversion=0):
+    if inversion == 0:
+        return f"{root} {chord_type}"
+    bass = NOTE_NAMES[(NOTE_INDEX[root] + CHORD_INTERVALS[chord_type][inversion]) % 12]
+    return f"{root} {chord_type}/{bass}"
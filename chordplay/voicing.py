@@ -0,0 +1,51 @@
+# 보이싱 생성기. 코드 구성음으로부터 close / open / drop2 / drop3 보이싱을 전위와 옥타브 이동별로 하나씩 만들어 내보낸다.
+# 필요한 만큼만 만들기 때문에 min()으로 하나를 고르거나 처음 몇 개만 쓸 때 전체 목록을 만들지 않는다
+#   for voicing in iter_voicings(generate_correct_answer('C', 'Major7'), styles=('drop2',), low=48, high=79):
+#       ...
+from chordplay.theory import iter_inversions
+
+VOICING_STYLES = ('close', 'open', 'drop2', 'drop3')
+OCTAVE_SHIFTS = (-1, 0, 1)
+
+# 아래에서 두 번째 음을 한 옥타브 올려 넓게 펼친 보이싱 (C E G -> C G E')
+def open_voicing(close):
+    return sorted(close[:1] + close[2:] + [close[1].transpose(12)], key=lambda note: note.midi)
+
+# 위에서 n번째 음을 한 옥타브 내림 (drop2 = 위에서 두 번째, drop3 = 위에서 세 번째)
+def drop_voicing(close, n):
+    voicing = close[:-n] + close[len(close) - n + 1:] + [close[-n].transpose(-12)]
+    return sorted(voicing, key=lambda note: note.midi)
+
+# close 보이싱(전위) 하나에서 style에 해당하는 보이싱을 만든다. 음 수가 모자라 만들 수 없으면 None
+def apply_style(close, style):
+    if style == 'close':
+        return close
+    if style == 'open':
+        return open_voicing(close) if len(close) >= 3 else None
+    if style == 'drop2':
+        return drop_voicing(close, 2) if len(close) >= 3 else None
+    if style == 'drop3':
+        return drop_voicing(close, 3) if len(close) >= 4 else None
+    raise ValueError(f"unknown voicing style: {style!r}")
+
+# 스타일 × 전위 × 옥타브 이동 순서로 보이싱(낮은 음부터 정렬한 Note 목록)을 내보낸다. 같은 음 구성은 한 번만.
+# low / high: 모든 음이 들어가야 하는 MIDI 범위 (포함), max_spread: 가장 낮은 음과 높은 음의 최대 간격(반음)
+def iter_voicings(chord_notes, styles=VOICING_STYLES, octaves=OCTAVE_SHIFTS, low=None, high=None, max_spread=None):
+    seen = set()
+    for style in styles:
+        for inversion in iter_inversions(chord_notes):
+            voicing = apply_style(sorted(inversion, key=lambda note: note.midi), style)
+            if voicing is None:
+                continue
+            if max_spread is not None and voicing[-1].midi - voicing[0].midi > max_spread:
+                continue
+            for octave in octaves:
+                bottom = voicing[0].midi + 12 * octave
+                top = voicing[-1].midi + 12 * octave
+                if (low is not None and bottom < low) or (high is not None and top > high):
+                    continue
+                midi = tuple(note.midi + 12 * octave for note in voicing)
+                if midi in seen:
+                    continue
+                seen.add(midi)
+                yield [note.transpose(12 * octave) for note in voicing]
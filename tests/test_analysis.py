@@ -0,0 +1,47 @@
+import struct
+
+import numpy as np
+import pytest
+
+from chordplay.analysis import KSDATAFORMAT_SUFFIX, open_wav_memmap
+from chordplay.samples import SampleBank
+
+SAMPLES = np.arange(-100, 100, dtype='<i2').tobytes()
+
+def fmt_chunk(audio_format, bits, channels=1, sample_rate=44100):
+    block_align = channels * bits // 8
+    return struct.pack('<HHIIHH', audio_format, channels, sample_rate, sample_rate * block_align, block_align, bits)
+
+def extensible_fmt(sub_format, bits):
+    return fmt_chunk(0xFFFE, bits) + struct.pack('<HHIH', 22, bits, 4, sub_format) + KSDATAFORMAT_SUFFIX
+
+def write_riff(path, chunks):
+    body = b'WAVE' + b''.join(chunk_id + struct.pack('<I', len(data)) + data for chunk_id, data in chunks)
+    path.write_bytes(b'RIFF' + struct.pack('<I', len(body)) + body)
+    return path
+
+@pytest.mark.parametrize('fmt', [fmt_chunk(1, 16), extensible_fmt(1, 16)])
+def test_open_integer_pcm(tmp_path, fmt):
+    path = write_riff(tmp_path / 'pcm.wav', [(b'fmt ', fmt), (b'data', SAMPLES)])
+    samples, sample_rate = open_wav_memmap(path)
+    assert sample_rate == 44100
+    assert samples.dtype == np.int16 and samples.shape == (200, 1)
+    assert samples[0, 0] == -100
+
+# float WAV(확장 형식 포함), SubFormat이 없는 확장 형식, fmt 청크가 없는 파일은 ValueError
+@pytest.mark.parametrize('chunks', [
+    [(b'fmt ', fmt_chunk(3, 32)), (b'data', SAMPLES)],
+    [(b'fmt ', extensible_fmt(3, 32)), (b'data', SAMPLES)],
+    [(b'fmt ', fmt_chunk(0xFFFE, 16)), (b'data', SAMPLES)],
+    [(b'data', SAMPLES)],
+    [(b'fmt ', fmt_chunk(1, 24)), (b'data', SAMPLES)],
+])
+def test_open_rejects_unsupported(tmp_path, chunks):
+    path = write_riff(tmp_path / 'bad.wav', chunks)
+    with pytest.raises(ValueError):
+        open_wav_memmap(path)
+
+def test_sample_bank_rejects_float(tmp_path):
+    write_riff(tmp_path / 'C4.wav', [(b'fmt ', extensible_fmt(3, 32)), (b'data', SAMPLES)])
+    with pytest.raises(ValueError):
+        SampleBank(tmp_path)
@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+from chordplay.progression import ii_v_i, render_progression
+
+def test_render_progression_length():
+    audio = render_progression(ii_v_i('C'), bpm=120, sample_rate=22050)
+    assert audio.dtype == np.int16
+    assert len(audio) == int(16 * 0.5 * 22050) + int(22050 * 0.02)
+
+@pytest.mark.parametrize('steps', [[], [('C', 'Major', 0)], [('C', 'Major', 4), ('G', 'Dominant7', -1)]])
+def test_render_progression_rejects_invalid_steps(steps):
+    with pytest.raises(ValueError):
+        render_progression(steps)
@@ -0,0 +1,28 @@
+import io
+import wave
+
+import pytest
+
+from chordplay.stream import drill_length, drill_segments, stream_wav, write_wav
+
+ITEMS = [('C', 'Major'), ('D', 'minor7')]
+
+def test_drill_length_matches_stream():
+    data = b''.join(stream_wav(drill_segments(90, items=ITEMS), num_samples=drill_length(90, items=ITEMS)))
+    with wave.open(io.BytesIO(data)) as wav_file:
+        assert wav_file.getnframes() == drill_length(90, items=ITEMS)
+
+# 헤더에 적은 길이와 실제 샘플 수가 다르면 ValueError
+def test_stream_wav_length_mismatch():
+    with pytest.raises(ValueError):
+        b''.join(stream_wav(drill_segments(90, items=ITEMS), num_samples=5))
+
+# 길이를 모른 채 제너레이터를 쓰면 탐색 가능한 파일에서는 다 쓴 뒤 실제 길이로 헤더를 고친다
+def test_write_wav_patches_unknown_length():
+    expected = b''.join(stream_wav(list(drill_segments(90, items=ITEMS))))
+    output = io.BytesIO()
+    written = write_wav(output, drill_segments(90, items=ITEMS))
+    assert written == len(expected)
+    assert output.getvalue() == expected
+    with wave.open(io.BytesIO(output.getvalue())) as wav_file:
+        assert wav_file.getnframes() == drill_length(90, items=ITEMS)
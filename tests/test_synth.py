@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from chordplay.oscillator import WavetableOscillator
+from chordplay.synth import (create_arpeggio_audio, create_chord_audio, create_chord_batch_audio, generate_quiz_set,
+                             note_to_freq, notes_to_freqs)
+from chordplay.theory import chord_types, generate_correct_answer, generate_inversions, keys
+
+# 미리 할당한 버퍼로 바꾸기 전의 구현 (np.concatenate로 음마다 이어 붙임). 출력이 비트 단위로 같아야 함
+def legacy_sine_wave(freq, duration, sample_rate=44100):
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    return np.sin(2 * np.pi * freq * t)
+
+def legacy_arpeggio_audio(frequencies, bpm, sample_rate=44100):
+    note_duration = 60 / bpm / 2
+    arpeggio = np.array([], dtype=np.int16)
+    for freq in frequencies:
+        note = legacy_sine_wave(freq, note_duration, sample_rate)
+        note = (note / np.max(np.abs(note)) * 32767).astype(np.int16)
+        arpeggio = np.concatenate((arpeggio, note))
+    return arpeggio
+
+@pytest.mark.parametrize('bpm', [60, 90, 120, 160, 240])
+@pytest.mark.parametrize('key, chord_type', [('C', 'Major'), ('F#', 'minor7'), ('A#', 'Half Diminished7')])
+def test_arpeggio_matches_legacy(bpm, key, chord_type):
+    frequencies = notes_to_freqs(generate_inversions(generate_correct_answer(key, chord_type)))
+    assert np.array_equal(create_arpeggio_audio(frequencies, bpm), legacy_arpeggio_audio(frequencies, bpm))
+
+@pytest.mark.parametrize('count', [1, 2, 7, 32])
+def test_arpeggio_note_counts(count):
+    frequencies = np.linspace(110, 880, count)
+    assert np.array_equal(create_arpeggio_audio(frequencies, 120), legacy_arpeggio_audio(frequencies, 120))
+
+def test_arpeggio_empty():
+    audio = create_arpeggio_audio([], 120)
+    assert audio.dtype == np.int16
+    assert np.array_equal(audio, legacy_arpeggio_audio([], 120))
+
+# 배치 합성의 각 행은 코드 하나씩 create_chord_audio로 만든 결과와 같아야 함 (성부 수가 섞여 있어도)
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_chord_batch_rows_match_single(dtype):
+    chords = [notes_to_freqs(generate_correct_answer(key, chord_type))
+              for key in keys[::3] for chord_type in chord_types]
+    batch = create_chord_batch_audio(chords, duration=0.5, batch_size=7, dtype=dtype)
+    for row, frequencies in zip(batch, chords):
+        assert np.array_equal(row, create_chord_audio(frequencies, duration=0.5, dtype=dtype))
+
+def test_quiz_set_is_seeded():
+    items, audio = generate_quiz_set(6, duration=0.25, seed=3)
+    again_items, again_audio = generate_quiz_set(6, duration=0.25, seed=3)
+    assert items == again_items and np.array_equal(audio, again_audio)
+    assert audio.shape == (6, int(44100 * 0.25)) and audio.dtype == np.int16
+
+# MIDI 0~127 밖의 음은 테이블을 거꾸로 읽거나 IndexError 대신 ValueError
+@pytest.mark.parametrize('notes', [['C-2'], ['C10'], ['G#9'], ['C4', 'C-2'], np.array([60, 128])])
+def test_notes_out_of_range(notes):
+    with pytest.raises(ValueError):
+        notes_to_freqs(notes)
+    if not isinstance(notes, np.ndarray):
+        with pytest.raises(ValueError):
+            note_to_freq(notes[-1])
+
+def test_notes_range_limits():
+    assert note_to_freq('C-1') == pytest.approx(8.1758, abs=1e-4)
+    assert note_to_freq('G9') == pytest.approx(12543.854, abs=1e-3)
+
+# 웨이브테이블 오실레이터로 만든 코드는 성부마다 위상 0에서 시작 (첫 샘플 0, 반복 호출해도 같은 결과)
+def test_wavetable_chord_voices_start_in_phase():
+    oscillator = WavetableOscillator('sine')
+    frequencies = notes_to_freqs(generate_correct_answer('C', 'Major7'))
+    chord = create_chord_audio(frequencies, 0.5, oscillator=oscillator)
+    assert chord[0] == 0
+    assert np.array_equal(chord, create_chord_audio(frequencies, 0.5, oscillator=oscillator))
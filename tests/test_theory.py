@@ -0,0 +1,49 @@
+import pytest
+
+from chordplay.theory import (Note, as_note, chord_inversions, chord_name, generate_correct_answer, identify_chord, keys,
+                              raise_octave)
+
+# 두 자리 / 음수 옥타브도 이름과 MIDI 번호 사이를 왕복해야 함
+@pytest.mark.parametrize('name, midi', [('C-1', 0), ('A-1', 9), ('C4', 60), ('A#3', 58), ('C10', 132), ('G9', 127)])
+def test_note_from_name(name, midi):
+    note = Note.from_name(name)
+    assert note.midi == midi
+    assert str(note) == name
+    assert as_note(name) == note == as_note(midi)
+
+@pytest.mark.parametrize('name, raised', [('B-1', 'B0'), ('A-1', 'A0'), ('G#8', 'G#9'), ('C9', 'C10')])
+def test_raise_octave(name, raised):
+    note = raise_octave(name)
+    assert str(note) == raised
+    assert Note.from_name(str(note)).transpose(-12) == Note.from_name(name)
+
+def test_every_note_name_round_trips():
+    for octave in range(-1, 11):
+        for key in keys:
+            name = f'{key}{octave}'
+            assert str(Note.from_name(name)) == name
+
+# 같은 음 집합은 가능한 이름을 모두 돌려주고, 전위는 가장 낮은 음으로 정해진다
+def test_identify_shared_pitch_set():
+    assert set(identify_chord(['A3', 'C4', 'E4', 'G4'])) == {('A', 'minor7', 0), ('C', 'Major6', 3)}
+    assert set(identify_chord(['C4', 'E4', 'G4', 'A4'])) == {('A', 'minor7', 1), ('C', 'Major6', 0)}
+
+def test_identify_symmetric_chord():
+    names = identify_chord(generate_correct_answer('C', 'Diminished7'))
+    assert set(names) == {('C', 'Diminished7', 0), ('D#', 'Diminished7', 3), ('F#', 'Diminished7', 2),
+                          ('A', 'Diminished7', 1)}
+
+@pytest.mark.parametrize('key, chord_type', [('C', 'Major'), ('F#', 'minor7'), ('A#', 'Half Diminished7'),
+                                             ('E', 'Dominant7')])
+def test_identify_every_inversion(key, chord_type):
+    for inversion, notes in enumerate(chord_inversions(generate_correct_answer(key, chord_type))):
+        assert (key, chord_type, inversion) in identify_chord(notes)
+
+def test_identify_unknown_or_empty():
+    assert identify_chord([]) == []
+    assert identify_chord(['C4', 'C#4', 'D4']) == []
+
+@pytest.mark.parametrize('args, name', [(('C', 'Major7'), 'C Major7'), (('C', 'Major', 1), 'C Major/E'),
+                                        (('A', 'minor7', 3), 'A minor7/G'), (('F#', 'Diminished7', 2), 'F# Diminished7/C')])
+def test_chord_name(args, name):
+    assert chord_name(*args) == name